@@ -1,5 +1,6 @@
 """Spotlight player commands."""
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -26,6 +27,9 @@ class SpotlightCog(commands.Cog):
             http_client = getattr(self.bot, 'http_client', None)
             if http_client:
                 self.spotlight_system = SpotlightSystem(http_client)
+                # Warm the spotlight caches in the background so the first
+                # command doesn't pay for the initial fetches
+                self._warm_task = asyncio.create_task(self.spotlight_system.warm_cache())
                 logger.info("Spotlight system initialized")
             else:
                 logger.warning("HTTP client not available for spotlight system")
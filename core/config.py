@@ -36,6 +36,13 @@ class Settings(BaseSettings):
     RECORDS_POLL_INTERVAL_SECONDS: int = Field(
         default=3600, description="Interval for records recomputation"
     )
+    SPOTLIGHT_CACHE_TTL: int = Field(
+        default=600, description="Seconds to reuse fetched spotlight data"
+    )
+    SPOTLIGHT_TYPE_WEIGHTS: str = Field(
+        default="3,3,3,1,3,1",
+        description="Comma-separated selection weights per spotlight type",
+    )
 
     # File paths
     STATE_PATH: str = Field(
@@ -70,6 +77,15 @@ class Settings(BaseSettings):
         """Get season endpoints as a list."""
         return [ep.strip() for ep in self.SEASON_ENDPOINTS.split(",") if ep.strip()]
 
+    @property
+    def spotlight_type_weights(self) -> List[float]:
+        """Get spotlight type weights as a list of floats."""
+        return [
+            float(w.strip())
+            for w in self.SPOTLIGHT_TYPE_WEIGHTS.split(",")
+            if w.strip()
+        ]
+
     @property
     def leaders_endpoint(self) -> str:
         """Get the leaders endpoint, falling back to first season endpoint."""
@@ -2,10 +2,12 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Any, AsyncIterator, Dict, Optional
 from urllib.parse import urlencode
 
 import aiohttp
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -21,9 +23,16 @@ logger = logging.getLogger(__name__)
 class HTTPClient:
     """HTTP client with retry logic and rate limiting."""
 
+    # Bound on remembered conditional-request entries; oldest are evicted
+    _CONDITIONAL_CACHE_MAX = 128
+
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
         self._rate_limit_semaphore = asyncio.Semaphore(10)  # Max 10 concurrent requests
+        # Validators and parsed body per URL for conditional requests:
+        # endpoints that send ETag/Last-Modified answer an unchanged
+        # resource with a bodyless 304 and we reuse the cached payload
+        self._conditional_cache: "OrderedDict[str, tuple]" = OrderedDict()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -54,15 +63,44 @@ class HTTPClient:
         """
         timeout = timeout or settings.HTTP_TIMEOUT
 
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        cached = self._conditional_cache.get(cache_key)
+        headers = {}
+        if cached:
+            validators = cached[0]
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
         async with self._rate_limit_semaphore:
             logger.debug(f"Making HTTP request to {url} with params {params}")
 
             try:
                 async with self.session.get(
-                    url, params=params, timeout=timeout
+                    url, params=params, timeout=timeout, headers=headers or None
                 ) as response:
+                    if response.status == 304 and cached:
+                        logger.debug(f"304 Not Modified for {url}, serving cached body")
+                        self._conditional_cache.move_to_end(cache_key)
+                        return cached[1]
+
                     response.raise_for_status()
-                    data = await response.json()
+                    # Decode straight from the response bytes with orjson:
+                    # faster than the stdlib json path behind response.json()
+                    # and skips its content-type negotiation
+                    data = orjson.loads(await response.read())
+
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self._conditional_cache[cache_key] = (
+                            {"etag": etag, "last_modified": last_modified},
+                            data,
+                        )
+                        self._conditional_cache.move_to_end(cache_key)
+                        while len(self._conditional_cache) > self._CONDITIONAL_CACHE_MAX:
+                            self._conditional_cache.popitem(last=False)
 
                     logger.debug(f"HTTP request successful for {url}, status: {response.status}, data length: {len(str(data)) if data else 0}")
                     return data
@@ -74,6 +112,57 @@ class HTTPClient:
                 logger.error(f"HTTP request error for {url}: {e}")
                 raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+    )
+    async def get_bytes(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> bytes:
+        """
+        Make a GET request and return the raw response body with retry logic.
+
+        For callers that decode the payload themselves (e.g. straight into
+        msgspec) and don't want the parsed-JSON handling in get_json.
+
+        Args:
+            url: Target URL
+            params: Query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Raw response bytes
+
+        Raises:
+            aiohttp.ClientError: On HTTP errors
+            asyncio.TimeoutError: On timeout
+        """
+        timeout = timeout or settings.HTTP_TIMEOUT
+
+        async with self._rate_limit_semaphore:
+            logger.debug(f"Making HTTP request to {url} with params {params}")
+
+            try:
+                async with self.session.get(
+                    url, params=params, timeout=timeout
+                ) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                    logger.debug(f"HTTP request successful for {url}, status: {response.status}, body length: {len(body)}")
+                    return body
+
+            except aiohttp.ClientResponseError as e:
+                logger.warning(f"HTTP request failed for {url}, status: {e.status}, message: {e.message}")
+                raise
+            except Exception as e:
+                logger.error(f"HTTP request error for {url}: {e}")
+                raise
+
     async def paginate(
         self, base_url: str, *, per_page: int = 100, max_pages: Optional[int] = None
     ) -> AsyncIterator[Dict[str, Any]]:
@@ -133,15 +222,69 @@ class HTTPClient:
         logger.info(f"Pagination completed for {base_url}, total pages: {total_pages or page - 1}")
 
 
+async def prefetch(
+    source: AsyncIterator[Any], *, distance: int = 2
+) -> AsyncIterator[Any]:
+    """
+    Run an async iterator ahead of its consumer.
+
+    A background task keeps pulling from ``source`` into a bounded queue,
+    so the next page is already in flight while the consumer parses the
+    current one — network latency overlaps with CPU work instead of
+    alternating with it.
+
+    Args:
+        source: Async iterator to read ahead from (e.g. a paginate call)
+        distance: How many items may be buffered ahead of the consumer
+
+    Yields:
+        Items from source, in order
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(distance, 1))
+    _end = object()
+
+    async def pump() -> None:
+        try:
+            async for item in source:
+                await queue.put((item, None))
+        except Exception as exc:
+            await queue.put((_end, exc))
+        else:
+            await queue.put((_end, None))
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            item, exc = await queue.get()
+            if item is _end:
+                if exc is not None:
+                    raise exc
+                break
+            yield item
+    finally:
+        task.cancel()
+
+
 async def create_http_session() -> aiohttp.ClientSession:
     """Create and configure an aiohttp session."""
     timeout = aiohttp.ClientTimeout(total=settings.HTTP_TIMEOUT)
 
+    # Every request goes to the same SportsPress host, so keep sockets
+    # pooled and warm between calls: paying the TCP/TLS handshake once per
+    # connection instead of once per request
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        keepalive_timeout=60,
+        enable_cleanup_closed=True,
+    )
+
     session = aiohttp.ClientSession(
         timeout=timeout,
+        connector=connector,
         headers={
             "User-Agent": "2KCompLeague-Discord-Bot/1.0",
             "Accept": "application/json",
+            "Connection": "keep-alive",
         },
     )
 
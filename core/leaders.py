@@ -193,10 +193,10 @@ async def top_n_season_leaders(client: HTTPClient, n: int = 3) -> LeadersData:
             "threes_made",
         ]:
             sorted_players = _stable_sort_leaders(players, stat)
-            leaders.__dict__[stat] = [
+            setattr(leaders, stat, [
                 LeaderEntry(name=name, value=value)
                 for name, value in sorted_players[:n]
-            ]
+            ])
 
         logger.info(f"Calculated season leaders for {len(players)} players")
         return leaders
@@ -246,10 +246,10 @@ async def top_n_career_leaders(
             "threes_made",
         ]:
             sorted_players = _stable_sort_leaders(players_list, stat)
-            leaders.__dict__[stat] = [
+            setattr(leaders, stat, [
                 LeaderEntry(name=name, value=value)
                 for name, value in sorted_players[:n]
-            ]
+            ])
 
         logger.info(f"Calculated career leaders for {len(players_list)} unique players")
         return leaders
@@ -1,7 +1,8 @@
 """Name resolution for players and teams from SportsPress API."""
 
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, Iterable, Optional
 
 from .config import settings
 from .http import HTTPClient
@@ -14,6 +15,24 @@ _team_names: Dict[int, str] = {}
 _player_urls: Dict[int, str] = {}
 _team_urls: Dict[int, str] = {}
 
+# Lookups currently on the wire, keyed by "<kind>:<id>". Concurrent callers
+# asking for the same uncached entity share one request instead of racing
+# the cache with duplicates.
+_inflight: Dict[str, "asyncio.Task"] = {}
+
+
+async def _single_flight(key: str, fetch: Callable[[], Awaitable[str]]) -> str:
+    """Run fetch() once per key, sharing the result with concurrent callers."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        try:
+            return await task
+        finally:
+            _inflight.pop(key, None)
+    return await task
+
 
 async def get_player_name(client: HTTPClient, player_id: int) -> str:
     """
@@ -31,18 +50,19 @@ async def get_player_name(client: HTTPClient, player_id: int) -> str:
     
     if player_id in _player_names:
         return _player_names[player_id]
-    
-    try:
-        player_data = await client.get_json(f"{settings.SPORTSPRESS_BASE}/players/{player_id}")
-        name = player_data.get("title", {}).get("rendered", f"Player {player_id}")
-        _player_names[player_id] = name
-        return name
-    except Exception as e:
-        logger.warning(f"Failed to fetch player name for ID {player_id}: {e}")
-        name = f"Player {player_id}"
+
+    async def fetch() -> str:
+        try:
+            player_data = await client.get_json(f"{settings.SPORTSPRESS_BASE}/players/{player_id}")
+            name = player_data.get("title", {}).get("rendered", f"Player {player_id}")
+        except Exception as e:
+            logger.warning(f"Failed to fetch player name for ID {player_id}: {e}")
+            name = f"Player {player_id}"
         _player_names[player_id] = name
         return name
 
+    return await _single_flight(f"player_name:{player_id}", fetch)
+
 
 async def get_team_name(client: HTTPClient, team_id: int) -> str:
     """
@@ -60,21 +80,22 @@ async def get_team_name(client: HTTPClient, team_id: int) -> str:
     
     if team_id in _team_names:
         return _team_names[team_id]
-    
-    try:
-        team_data = await client.get_json(f"{settings.SPORTSPRESS_BASE}/teams/{team_id}")
-        name = team_data.get("title", {}).get("rendered", f"Team {team_id}")
-        _team_names[team_id] = name
-        return name
-    except Exception as e:
-        # Cache the failure to avoid repeated API calls for missing teams
-        name = f"Team {team_id}"
+
+    async def fetch() -> str:
+        try:
+            team_data = await client.get_json(f"{settings.SPORTSPRESS_BASE}/teams/{team_id}")
+            name = team_data.get("title", {}).get("rendered", f"Team {team_id}")
+        except Exception as e:
+            # Cache the failure to avoid repeated API calls for missing teams
+            name = f"Team {team_id}"
+            # Only log warning for first attempt to avoid spam
+            if "Failed to fetch team name" not in str(e):
+                logger.warning(f"Failed to fetch team name for ID {team_id}: {e}")
         _team_names[team_id] = name
-        # Only log warning for first attempt to avoid spam
-        if "Failed to fetch team name" not in str(e):
-            logger.warning(f"Failed to fetch team name for ID {team_id}: {e}")
         return name
 
+    return await _single_flight(f"team_name:{team_id}", fetch)
+
 
 async def get_player_url(client: HTTPClient, player_id: int) -> str:
     """
@@ -93,38 +114,41 @@ async def get_player_url(client: HTTPClient, player_id: int) -> str:
     # Check cache first
     if player_id in _player_urls:
         return _player_urls[player_id]
-    
-    try:
-        # Fetch player data from SportsPress API
-        url = f"{settings.SPORTSPRESS_BASE}/players/{player_id}"
-        data = await client.get_json(url)
-        
-        if data and isinstance(data, dict):
-            player_url = data.get("link", "")
-            if player_url:
-                _player_urls[player_id] = player_url
-                return player_url
-        
-        # Fallback: construct URL from player name if we have it
-        if player_id in _player_names:
-            player_name = _player_names[player_id]
-            # Convert name to slug format
-            slug = player_name.lower().replace(" ", "-").replace("_", "-")
-            fallback_url = f"https://2kcompleague.com/player/{slug}/"
+
+    async def fetch() -> str:
+        try:
+            # Fetch player data from SportsPress API
+            url = f"{settings.SPORTSPRESS_BASE}/players/{player_id}"
+            data = await client.get_json(url)
+
+            if data and isinstance(data, dict):
+                player_url = data.get("link", "")
+                if player_url:
+                    _player_urls[player_id] = player_url
+                    return player_url
+
+            # Fallback: construct URL from player name if we have it
+            if player_id in _player_names:
+                player_name = _player_names[player_id]
+                # Convert name to slug format
+                slug = player_name.lower().replace(" ", "-").replace("_", "-")
+                fallback_url = f"https://2kcompleague.com/player/{slug}/"
+                _player_urls[player_id] = fallback_url
+                return fallback_url
+
+            # Final fallback: use ID-based URL
+            fallback_url = f"https://2kcompleague.com/player/{player_id}/"
             _player_urls[player_id] = fallback_url
             return fallback_url
-        
-        # Final fallback: use ID-based URL
-        fallback_url = f"https://2kcompleague.com/player/{player_id}/"
-        _player_urls[player_id] = fallback_url
-        return fallback_url
-        
-    except Exception as e:
-        logger.warning(f"Failed to fetch player URL for ID {player_id}: {e}")
-        # Fallback: use ID-based URL
-        fallback_url = f"https://2kcompleague.com/player/{player_id}/"
-        _player_urls[player_id] = fallback_url
-        return fallback_url
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch player URL for ID {player_id}: {e}")
+            # Fallback: use ID-based URL
+            fallback_url = f"https://2kcompleague.com/player/{player_id}/"
+            _player_urls[player_id] = fallback_url
+            return fallback_url
+
+    return await _single_flight(f"player_url:{player_id}", fetch)
 
 
 async def get_team_url(client: HTTPClient, team_id: int) -> str:
@@ -144,38 +168,146 @@ async def get_team_url(client: HTTPClient, team_id: int) -> str:
     # Check cache first
     if team_id in _team_urls:
         return _team_urls[team_id]
-    
-    try:
-        # Fetch team data from SportsPress API
-        url = f"{settings.SPORTSPRESS_BASE}/teams/{team_id}"
-        data = await client.get_json(url)
-        
-        if data and isinstance(data, dict):
-            team_url = data.get("link", "")
-            if team_url:
-                _team_urls[team_id] = team_url
-                return team_url
-        
-        # Fallback: construct URL from team name if we have it
-        if team_id in _team_names:
-            team_name = _team_names[team_id]
-            # Convert name to slug format
-            slug = team_name.lower().replace(" ", "-").replace("_", "-")
-            fallback_url = f"https://2kcompleague.com/team/{slug}/"
+
+    async def fetch() -> str:
+        try:
+            # Fetch team data from SportsPress API
+            url = f"{settings.SPORTSPRESS_BASE}/teams/{team_id}"
+            data = await client.get_json(url)
+
+            if data and isinstance(data, dict):
+                team_url = data.get("link", "")
+                if team_url:
+                    _team_urls[team_id] = team_url
+                    return team_url
+
+            # Fallback: construct URL from team name if we have it
+            if team_id in _team_names:
+                team_name = _team_names[team_id]
+                # Convert name to slug format
+                slug = team_name.lower().replace(" ", "-").replace("_", "-")
+                fallback_url = f"https://2kcompleague.com/team/{slug}/"
+                _team_urls[team_id] = fallback_url
+                return fallback_url
+
+            # Final fallback: use ID-based URL
+            fallback_url = f"https://2kcompleague.com/team/{team_id}/"
             _team_urls[team_id] = fallback_url
             return fallback_url
-        
-        # Final fallback: use ID-based URL
-        fallback_url = f"https://2kcompleague.com/team/{team_id}/"
-        _team_urls[team_id] = fallback_url
-        return fallback_url
-        
-    except Exception as e:
-        logger.warning(f"Failed to fetch team URL for ID {team_id}: {e}")
-        # Fallback: use ID-based URL
-        fallback_url = f"https://2kcompleague.com/team/{team_id}/"
-        _team_urls[team_id] = fallback_url
-        return fallback_url
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch team URL for ID {team_id}: {e}")
+            # Fallback: use ID-based URL
+            fallback_url = f"https://2kcompleague.com/team/{team_id}/"
+            _team_urls[team_id] = fallback_url
+            return fallback_url
+
+    return await _single_flight(f"team_url:{team_id}", fetch)
+
+
+async def prefetch_players(client: HTTPClient, player_ids: Iterable[int]) -> None:
+    """
+    Warm the player name and URL caches in bulk.
+
+    Uses the WordPress REST include= filter so up to 100 players resolve with
+    one request instead of one request per id. Ids already cached are skipped;
+    failures fall back to the per-id getters.
+
+    Args:
+        client: HTTP client instance
+        player_ids: Player IDs to resolve
+    """
+    missing = [
+        player_id for player_id in player_ids
+        if player_id is not None
+        and (player_id not in _player_names or player_id not in _player_urls)
+    ]
+
+    for start in range(0, len(missing), 100):
+        chunk = missing[start:start + 100]
+        ids_csv = ",".join(map(str, chunk))
+        url = (
+            f"{settings.SPORTSPRESS_BASE}/players"
+            f"?include={ids_csv}&per_page=100&_fields=id,title,link"
+        )
+        try:
+            data = await client.get_json(url)
+        except Exception as e:
+            logger.warning(f"Bulk player fetch failed: {e}")
+            return
+
+        if isinstance(data, list):
+            for player in data:
+                player_id = player.get("id")
+                if player_id is None:
+                    continue
+                _player_names[player_id] = player.get("title", {}).get(
+                    "rendered", f"Player {player_id}"
+                )
+                if player.get("link"):
+                    _player_urls[player_id] = player["link"]
+
+
+async def get_player_urls_bulk(
+    client: HTTPClient, player_ids: Iterable[int]
+) -> Dict[int, str]:
+    """
+    Resolve profile URLs for many players at once.
+
+    Warms the shared caches with one include= query via prefetch_players,
+    then reads each id back through get_player_url so ids the bulk query
+    missed still get the usual per-id fallbacks.
+
+    Args:
+        client: HTTP client instance
+        player_ids: Player IDs to resolve
+
+    Returns:
+        Mapping of player ID to profile URL
+    """
+    ids = [player_id for player_id in player_ids if player_id is not None]
+    await prefetch_players(client, ids)
+    return {
+        player_id: await get_player_url(client, player_id) for player_id in ids
+    }
+
+
+async def prefetch_teams(client: HTTPClient, team_ids: Iterable[int]) -> None:
+    """
+    Warm the team name and URL caches in bulk.
+
+    Args:
+        client: HTTP client instance
+        team_ids: Team IDs to resolve
+    """
+    missing = [
+        team_id for team_id in team_ids
+        if team_id is not None and team_id not in _team_names
+    ]
+
+    for start in range(0, len(missing), 100):
+        chunk = missing[start:start + 100]
+        ids_csv = ",".join(map(str, chunk))
+        url = (
+            f"{settings.SPORTSPRESS_BASE}/teams"
+            f"?include={ids_csv}&per_page=100&_fields=id,title,link"
+        )
+        try:
+            data = await client.get_json(url)
+        except Exception as e:
+            logger.warning(f"Bulk team fetch failed: {e}")
+            return
+
+        if isinstance(data, list):
+            for team in data:
+                team_id = team.get("id")
+                if team_id is None:
+                    continue
+                _team_names[team_id] = team.get("title", {}).get(
+                    "rendered", f"Team {team_id}"
+                )
+                if team.get("link"):
+                    _team_urls[team_id] = team["link"]
 
 
 def clear_name_cache():
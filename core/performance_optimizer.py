@@ -16,6 +16,56 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+# Bit flags for optimization opportunities detected by analyze_performance.
+# Encoding opportunities/actions as small ints keeps the hot analysis path
+# allocation-free; names are only materialized at the API boundary.
+_OPP_CPU_HIGH = 1 << 0
+_OPP_CPU_ELEVATED = 1 << 1
+_OPP_MEMORY_HIGH = 1 << 2
+_OPP_MEMORY_ELEVATED = 1 << 3
+_OPP_RESPONSE_HIGH = 1 << 4
+_OPP_RESPONSE_ELEVATED = 1 << 5
+_OPP_ERROR_HIGH = 1 << 6
+_OPP_ERROR_ELEVATED = 1 << 7
+
+# Opportunity names indexed by bit position.
+_OPPORTUNITY_NAMES = (
+    "high_cpu_usage",
+    "elevated_cpu_usage",
+    "high_memory_usage",
+    "elevated_memory_usage",
+    "slow_response_time",
+    "elevated_response_time",
+    "high_error_rate",
+    "elevated_error_rate",
+)
+
+# Any of these bits set means the overall priority is "high".
+_OPP_HIGH_MASK = _OPP_CPU_HIGH | _OPP_MEMORY_HIGH | _OPP_RESPONSE_HIGH | _OPP_ERROR_HIGH
+
+# Bit flags for recommended optimization actions.
+_ACT_BACKGROUND_TASKS = 1 << 0
+_ACT_MEMORY_CLEANUP = 1 << 1
+_ACT_API_BATCHING = 1 << 2
+_ACT_RESPONSE_CACHING = 1 << 3
+_ACT_CONNECTION_POOLING = 1 << 4
+_ACT_RATE_LIMITING = 1 << 5
+
+# Action names indexed by bit position; dedup is automatic via bitwise OR.
+_ACTION_NAMES = (
+    "background_task_optimization",
+    "memory_cleanup",
+    "api_batching",
+    "response_caching",
+    "connection_pooling",
+    "rate_limiting",
+)
+
+
+def _decode_bitmask(mask: int, names: tuple) -> List[str]:
+    """Decode a bitmask into its corresponding name strings."""
+    return [name for i, name in enumerate(names) if mask & (1 << i)]
+
 
 @dataclass
 class OptimizationAction:
@@ -93,7 +143,58 @@ class PerformanceOptimizer:
     def analyze_performance(self, metrics: PerformanceMetrics) -> Dict[str, Any]:
         """Analyze current performance and identify optimization opportunities."""
         
-        analysis = {
+        thresholds = self.optimization_thresholds
+
+        # Accumulate opportunities as a bitmask (no allocations in the hot path)
+        opportunities = 0
+        if metrics.cpu_percent > thresholds["cpu_high"]:
+            opportunities |= _OPP_CPU_HIGH
+        elif metrics.cpu_percent > thresholds["cpu_medium"]:
+            opportunities |= _OPP_CPU_ELEVATED
+
+        if metrics.memory_percent > thresholds["memory_high"]:
+            opportunities |= _OPP_MEMORY_HIGH
+        elif metrics.memory_percent > thresholds["memory_medium"]:
+            opportunities |= _OPP_MEMORY_ELEVATED
+
+        if metrics.response_time_avg_ms > thresholds["response_time_high"]:
+            opportunities |= _OPP_RESPONSE_HIGH
+        elif metrics.response_time_avg_ms > thresholds["response_time_medium"]:
+            opportunities |= _OPP_RESPONSE_ELEVATED
+
+        if metrics.error_rate > thresholds["error_rate_high"]:
+            opportunities |= _OPP_ERROR_HIGH
+        elif metrics.error_rate > thresholds["error_rate_medium"]:
+            opportunities |= _OPP_ERROR_ELEVATED
+
+        # Map opportunities to recommended actions; OR dedups repeats for free
+        actions = 0
+        if opportunities & _OPP_CPU_HIGH:
+            actions |= _ACT_BACKGROUND_TASKS | _ACT_API_BATCHING
+        if opportunities & _OPP_CPU_ELEVATED:
+            actions |= _ACT_BACKGROUND_TASKS
+        if opportunities & _OPP_MEMORY_HIGH:
+            actions |= _ACT_MEMORY_CLEANUP | _ACT_RESPONSE_CACHING
+        if opportunities & _OPP_MEMORY_ELEVATED:
+            actions |= _ACT_MEMORY_CLEANUP
+        if opportunities & _OPP_RESPONSE_HIGH:
+            actions |= _ACT_API_BATCHING | _ACT_CONNECTION_POOLING
+        if opportunities & _OPP_RESPONSE_ELEVATED:
+            actions |= _ACT_CONNECTION_POOLING
+        if opportunities & _OPP_ERROR_HIGH:
+            actions |= _ACT_RATE_LIMITING | _ACT_CONNECTION_POOLING
+        if opportunities & _OPP_ERROR_ELEVATED:
+            actions |= _ACT_RATE_LIMITING
+
+        if opportunities & _OPP_HIGH_MASK:
+            priority = "high"
+        elif opportunities:
+            priority = "medium"
+        else:
+            priority = "low"
+
+        # Decode bitmasks to strings only at the API boundary
+        return {
             "timestamp": metrics.timestamp.isoformat(),
             "current_metrics": {
                 "cpu_percent": metrics.cpu_percent,
@@ -101,63 +202,10 @@ class PerformanceOptimizer:
                 "response_time_ms": metrics.response_time_avg_ms,
                 "error_rate": metrics.error_rate
             },
-            "optimization_opportunities": [],
-            "recommended_actions": [],
-            "priority": "low"
+            "optimization_opportunities": _decode_bitmask(opportunities, _OPPORTUNITY_NAMES),
+            "recommended_actions": _decode_bitmask(actions, _ACTION_NAMES),
+            "priority": priority
         }
-        
-        # Check CPU usage
-        if metrics.cpu_percent > self.optimization_thresholds["cpu_high"]:
-            analysis["optimization_opportunities"].append("high_cpu_usage")
-            analysis["recommended_actions"].append("background_task_optimization")
-            analysis["recommended_actions"].append("api_batching")
-            analysis["priority"] = "high"
-        elif metrics.cpu_percent > self.optimization_thresholds["cpu_medium"]:
-            analysis["optimization_opportunities"].append("elevated_cpu_usage")
-            analysis["recommended_actions"].append("background_task_optimization")
-            if analysis["priority"] != "high":
-                analysis["priority"] = "medium"
-        
-        # Check memory usage
-        if metrics.memory_percent > self.optimization_thresholds["memory_high"]:
-            analysis["optimization_opportunities"].append("high_memory_usage")
-            analysis["recommended_actions"].append("memory_cleanup")
-            analysis["recommended_actions"].append("response_caching")
-            analysis["priority"] = "high"
-        elif metrics.memory_percent > self.optimization_thresholds["memory_medium"]:
-            analysis["optimization_opportunities"].append("elevated_memory_usage")
-            analysis["recommended_actions"].append("memory_cleanup")
-            if analysis["priority"] != "high":
-                analysis["priority"] = "medium"
-        
-        # Check response times
-        if metrics.response_time_avg_ms > self.optimization_thresholds["response_time_high"]:
-            analysis["optimization_opportunities"].append("slow_response_time")
-            analysis["recommended_actions"].append("api_batching")
-            analysis["recommended_actions"].append("connection_pooling")
-            analysis["priority"] = "high"
-        elif metrics.response_time_avg_ms > self.optimization_thresholds["response_time_medium"]:
-            analysis["optimization_opportunities"].append("elevated_response_time")
-            analysis["recommended_actions"].append("connection_pooling")
-            if analysis["priority"] != "high":
-                analysis["priority"] = "medium"
-        
-        # Check error rates
-        if metrics.error_rate > self.optimization_thresholds["error_rate_high"]:
-            analysis["optimization_opportunities"].append("high_error_rate")
-            analysis["recommended_actions"].append("rate_limiting")
-            analysis["recommended_actions"].append("connection_pooling")
-            analysis["priority"] = "high"
-        elif metrics.error_rate > self.optimization_thresholds["error_rate_medium"]:
-            analysis["optimization_opportunities"].append("elevated_error_rate")
-            analysis["recommended_actions"].append("rate_limiting")
-            if analysis["priority"] != "high":
-                analysis["priority"] = "medium"
-        
-        # Remove duplicates from recommended actions
-        analysis["recommended_actions"] = list(set(analysis["recommended_actions"]))
-        
-        return analysis
     
     async def apply_optimization(self, optimization_name: str) -> Dict[str, Any]:
         """Apply a specific optimization."""
@@ -2,21 +2,114 @@
 
 import asyncio
 import logging
-import random
+import math
 import time
+from array import array
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Callable, Awaitable
-from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import psutil
 
-from .performance import get_performance_monitor, performance_benchmark
+from .performance import get_performance_monitor
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _LatencyHistogram:
+    """Log-bucketed latency histogram with O(1) inserts and bounded memory.
+
+    Samples land in buckets keyed by ``int((log10(value) + 5) * 10)`` (~26%
+    relative bucket width), so memory stays constant regardless of test
+    duration or RPS. The unit is the caller's choice (this module records
+    nanoseconds); count, sum, min and max are tracked exactly, and
+    percentiles are interpolated from the bucket counts.
+    """
+
+    _BUCKETS = 200
+
+    __slots__ = ("_counts", "_count", "_sum", "_min", "_max")
+
+    def __init__(self):
+        self._counts = np.zeros(self._BUCKETS, dtype=np.int64)
+        self._count = 0
+        self._sum = 0
+        self._min = float("inf")
+        self._max = 0
+
+    def record(self, value: float) -> None:
+        if value > 0:
+            bucket = int((math.log10(value) + 5) * 10)
+            bucket = min(max(bucket, 0), self._BUCKETS - 1)
+        else:
+            bucket = 0
+        self._counts[bucket] += 1
+        self._count += 1
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def min(self) -> float:
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def percentile(self, percent: float) -> float:
+        """Estimate the latency at the given percentile from the buckets."""
+        return self.percentiles((percent,))[0]
+
+    def percentiles(self, percents) -> List[float]:
+        """Estimate several percentiles sharing one cumulative-count pass."""
+        if not self._count:
+            return [0.0] * len(percents)
+        cumulative = np.cumsum(self._counts)
+        results = []
+        for percent in percents:
+            rank = max(int(self._count * percent / 100.0), 1)
+            bucket = int(np.searchsorted(cumulative, rank))
+            # Geometric midpoint of the bucket, clamped to the observed range
+            value = 10 ** ((bucket + 0.5) / 10 - 5)
+            results.append(min(max(value, self._min), self._max))
+        return results
+
+
+class _RequestTally:
+    """Success/failure counters for completed requests.
+
+    Replaces the per-request ``List[bool]`` (one PyObject pointer per
+    request plus an O(n) ``sum()`` afterwards) with two plain integers.
+    """
+
+    __slots__ = ("successes", "failures")
+
+    def __init__(self):
+        self.successes = 0
+        self.failures = 0
+
+    def record(self, success: bool) -> None:
+        if success:
+            self.successes += 1
+        else:
+            self.failures += 1
+
+    def __len__(self) -> int:
+        return self.successes + self.failures
+
+
+@dataclass(frozen=True)
 class LoadTestConfig:
     """Configuration for load testing."""
     
@@ -30,6 +123,40 @@ class LoadTestConfig:
     max_error_rate: float = 5.0
 
 
+# Predefined scenarios, built once at import; configs are frozen so the
+# shared instances cannot be mutated by one test run for the next
+_TEST_SCENARIOS = {
+    "light_load": LoadTestConfig(
+        test_name="Light Load Test",
+        duration_seconds=120,
+        concurrent_users=5,
+        requests_per_second=2.0,
+        target_response_time_ms=500.0
+    ),
+    "normal_load": LoadTestConfig(
+        test_name="Normal Load Test",
+        duration_seconds=300,
+        concurrent_users=10,
+        requests_per_second=5.0,
+        target_response_time_ms=1000.0
+    ),
+    "heavy_load": LoadTestConfig(
+        test_name="Heavy Load Test",
+        duration_seconds=600,
+        concurrent_users=25,
+        requests_per_second=10.0,
+        target_response_time_ms=2000.0
+    ),
+    "stress_test": LoadTestConfig(
+        test_name="Stress Test",
+        duration_seconds=900,
+        concurrent_users=50,
+        requests_per_second=20.0,
+        target_response_time_ms=5000.0
+    )
+}
+
+
 @dataclass
 class LoadTestResult:
     """Results from a load test."""
@@ -61,38 +188,12 @@ class LoadTester:
         self.test_results: List[LoadTestResult] = []
         self.current_test: Optional[LoadTestConfig] = None
         self.is_running = False
+        # One persistent handle; creating psutil.Process() per sample re-reads
+        # /proc and allocates a new object every tick
+        self._process = psutil.Process()
         
-        # Test scenarios
-        self.test_scenarios = {
-            "light_load": LoadTestConfig(
-                test_name="Light Load Test",
-                duration_seconds=120,
-                concurrent_users=5,
-                requests_per_second=2.0,
-                target_response_time_ms=500.0
-            ),
-            "normal_load": LoadTestConfig(
-                test_name="Normal Load Test",
-                duration_seconds=300,
-                concurrent_users=10,
-                requests_per_second=5.0,
-                target_response_time_ms=1000.0
-            ),
-            "heavy_load": LoadTestConfig(
-                test_name="Heavy Load Test",
-                duration_seconds=600,
-                concurrent_users=25,
-                requests_per_second=10.0,
-                target_response_time_ms=2000.0
-            ),
-            "stress_test": LoadTestConfig(
-                test_name="Stress Test",
-                duration_seconds=900,
-                concurrent_users=50,
-                requests_per_second=20.0,
-                target_response_time_ms=5000.0
-            )
-        }
+        # Test scenarios (shared module-level constants)
+        self.test_scenarios = _TEST_SCENARIOS
     
     async def run_load_test(
         self,
@@ -113,18 +214,22 @@ class LoadTester:
         start_time = datetime.now()
         end_time = start_time + timedelta(seconds=config.duration_seconds)
         
-        # Performance tracking
-        response_times: List[float] = []
-        request_results: List[bool] = []
-        cpu_samples: List[float] = []
-        memory_samples: List[float] = []
-        
         # Calculate request intervals
         request_interval = 1.0 / config.requests_per_second
         total_requests = int(config.requests_per_second * config.duration_seconds)
-        
-        # Start performance monitoring
-        monitor_task = asyncio.create_task(self._monitor_performance(cpu_samples, memory_samples))
+
+        # Performance tracking
+        response_times = _LatencyHistogram()
+        request_results = _RequestTally()
+        cpu_samples = array("f")
+        memory_samples = array("f")
+        
+        # Start performance monitoring; the event lets the monitor wind down
+        # cleanly instead of being cancelled mid-sample
+        stop_monitoring = asyncio.Event()
+        monitor_task = asyncio.create_task(
+            self._monitor_performance(cpu_samples, memory_samples, stop_monitoring)
+        )
         
         try:
             # Run the load test
@@ -135,7 +240,8 @@ class LoadTester:
             
         finally:
             # Stop monitoring
-            monitor_task.cancel()
+            stop_monitoring.set()
+            await monitor_task
             self.is_running = False
             self.current_test = None
         
@@ -156,8 +262,8 @@ class LoadTester:
         self,
         config: LoadTestConfig,
         test_function: Callable[[], Awaitable[Any]],
-        response_times: List[float],
-        request_results: List[bool],
+        response_times: _LatencyHistogram,
+        request_results: _RequestTally,
         request_interval: float,
         total_requests: int,
         end_time: datetime
@@ -170,81 +276,100 @@ class LoadTester:
         async def single_request():
             """Execute a single test request."""
             async with semaphore:
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 try:
                     await test_function()
                     success = True
                 except Exception as e:
                     logger.debug(f"Request failed: {e}")
                     success = False
-                
-                response_time = (time.time() - start_time) * 1000
-                response_times.append(response_time)
-                request_results.append(success)
-        
-        # Calculate ramp-up and ramp-down periods
-        ramp_up_end = datetime.now() + timedelta(seconds=config.ramp_up_seconds)
-        ramp_down_start = end_time - timedelta(seconds=config.ramp_down_seconds)
-        
+
+                # Integer nanosecond delta; converted to ms only at report time
+                response_times.record(time.perf_counter_ns() - start_ns)
+                request_results.record(success)
+        
+        # Ramp phases as monotonic offsets: one clock read per iteration
+        # instead of four-plus datetime.now() syscalls/allocations
+        start_monotonic = time.monotonic()
+        duration = max((end_time - datetime.now()).total_seconds(), 0.0)
+        inv_ramp_up = 1.0 / max(config.ramp_up_seconds, 1e-9)
+        inv_ramp_down = 1.0 / max(config.ramp_down_seconds, 1e-9)
+
         current_rps = 0
         target_rps = config.requests_per_second
-        
-        while datetime.now() < end_time:
-            # Ramp up
-            if datetime.now() < ramp_up_end:
-                progress = (datetime.now() - datetime.now() + timedelta(seconds=config.ramp_up_seconds)).total_seconds() / config.ramp_up_seconds
-                current_rps = target_rps * progress
-            # Ramp down
-            elif datetime.now() > ramp_down_start:
-                progress = (end_time - datetime.now()).total_seconds() / config.ramp_down_seconds
-                current_rps = target_rps * progress
-            else:
-                current_rps = target_rps
+
+        # Absolute deadline for the next batch; sleeping until a deadline
+        # rather than for a fixed interval keeps achieved RPS on target even
+        # when a batch overruns (missed ticks fire immediately as catch-up)
+        next_fire = time.monotonic()
+
+        while (elapsed := time.monotonic() - start_monotonic) < duration:
+            # Branchless ramp factor: rises over ramp-up, holds at 1.0 in the
+            # steady phase, falls over ramp-down; the min/max clamp replaces
+            # the three-way phase branch
+            ramp = min(1.0, elapsed * inv_ramp_up, (duration - elapsed) * inv_ramp_down)
+            current_rps = target_rps * max(ramp, 0.0)
             
             # Execute requests based on current RPS
             if current_rps > 0:
-                interval = 1.0 / current_rps
-                await asyncio.sleep(interval)
-                
-                # Create multiple concurrent requests
-                tasks = []
-                for i in range(min(config.concurrent_users, int(current_rps))):
-                    tasks.append(asyncio.create_task(single_request()))
+                # Cap the pacing interval so a near-zero ramp RPS cannot stall the loop
+                interval = min(1.0 / current_rps, 1.0)
+                delay = next_fire - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # Advance by the current interval; the ramp may have changed
+                # the interval, but the deadline stays absolute
+                next_fire += interval
                 
+                # Create multiple concurrent requests in one pass;
+                # single_request handles its own failures, so gather needs
+                # no per-task exception wrapping
+                tasks = [
+                    asyncio.create_task(single_request())
+                    for _ in range(min(config.concurrent_users, int(current_rps)))
+                ]
                 if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
+                    await asyncio.gather(*tasks)
     
     async def _monitor_performance(
         self,
-        cpu_samples: List[float],
-        memory_samples: List[float]
+        cpu_samples: array,
+        memory_samples: array,
+        stop_event: asyncio.Event
     ):
         """Monitor system performance during the load test."""
-        while self.is_running:
+        while not stop_event.is_set():
             try:
-                process = psutil.Process()
-                cpu_samples.append(process.cpu_percent())
-                memory_samples.append(process.memory_percent())
-                await asyncio.sleep(1)  # Sample every second
+                # oneshot() batches the /proc reads behind both samples
+                with self._process.oneshot():
+                    cpu_samples.append(self._process.cpu_percent())
+                    memory_samples.append(self._process.memory_percent())
+                delay = 1  # Sample every second
             except Exception as e:
                 logger.error(f"Performance monitoring error: {e}")
-                await asyncio.sleep(5)
+                delay = 5
+            try:
+                # Waiting on the event doubles as the sample interval and as
+                # an immediate wake-up when the test finishes
+                await asyncio.wait_for(stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
     
     def _calculate_test_results(
         self,
         config: LoadTestConfig,
         start_time: datetime,
         end_time: datetime,
-        response_times: List[float],
-        request_results: List[bool],
-        cpu_samples: List[float],
-        memory_samples: List[float]
+        response_times: _LatencyHistogram,
+        request_results: _RequestTally,
+        cpu_samples: array,
+        memory_samples: array
     ) -> LoadTestResult:
         """Calculate test results from collected data."""
         
         total_requests = len(request_results)
-        successful_requests = sum(request_results)
-        failed_requests = total_requests - successful_requests
+        successful_requests = request_results.successes
+        failed_requests = request_results.failures
         
         if not response_times:
             return LoadTestResult(
@@ -267,18 +392,18 @@ class LoadTester:
                 status="failed"
             )
         
-        # Response time statistics
-        total_response_time = sum(response_times)
-        min_response_time = min(response_times)
-        max_response_time = max(response_times)
+        # Response time statistics: the histogram records integer nanoseconds,
+        # so convert to milliseconds here at the report boundary
+        ns_per_ms = 1_000_000
+        total_response_time = response_times.sum / ns_per_ms
+        min_response_time = response_times.min / ns_per_ms
+        max_response_time = response_times.max / ns_per_ms
         avg_response_time = total_response_time / len(response_times)
-        
-        # Percentiles
-        sorted_times = sorted(response_times)
-        p95_index = int(len(sorted_times) * 0.95)
-        p99_index = int(len(sorted_times) * 0.99)
-        p95_response_time = sorted_times[p95_index] if p95_index < len(sorted_times) else max_response_time
-        p99_response_time = sorted_times[p99_index] if p99_index < len(sorted_times) else max_response_time
+
+        # Percentiles from the log buckets (O(buckets), no sample storage)
+        p95_ns, p99_ns = response_times.percentiles((95, 99))
+        p95_response_time = p95_ns / ns_per_ms
+        p99_response_time = p99_ns / ns_per_ms
         
         # Calculate RPS and error rate
         duration = (end_time - start_time).total_seconds()
@@ -334,19 +459,19 @@ class LoadTester:
         failed_tests = sum(1 for r in self.test_results if r.status == "failed")
         degraded_tests = sum(1 for r in self.test_results if r.status == "degraded")
         
-        # Calculate overall performance metrics
-        all_response_times = []
-        all_error_rates = []
-        all_cpu_usage = []
-        all_memory_usage = []
-        
+        # Calculate overall performance metrics in a single fold over the
+        # results instead of materializing four parallel lists
+        counted_tests = 0
+        response_time_sum = error_rate_sum = cpu_sum = memory_sum = 0.0
+
         for result in self.test_results:
             if result.total_requests > 0:
-                all_response_times.append(result.avg_response_time_ms)
-                all_error_rates.append(result.error_rate)
-                all_cpu_usage.append(result.cpu_usage_avg)
-                all_memory_usage.append(result.memory_usage_avg)
-        
+                counted_tests += 1
+                response_time_sum += result.avg_response_time_ms
+                error_rate_sum += result.error_rate
+                cpu_sum += result.cpu_usage_avg
+                memory_sum += result.memory_usage_avg
+
         return {
             "status": "summary",
             "total_tests": total_tests,
@@ -357,10 +482,10 @@ class LoadTester:
                 "success_rate": (passed_tests / total_tests * 100) if total_tests > 0 else 0
             },
             "performance_summary": {
-                "avg_response_time_ms": sum(all_response_times) / len(all_response_times) if all_response_times else 0,
-                "avg_error_rate": sum(all_error_rates) / len(all_error_rates) if all_error_rates else 0,
-                "avg_cpu_usage": sum(all_cpu_usage) / len(all_cpu_usage) if all_cpu_usage else 0,
-                "avg_memory_usage": sum(all_memory_usage) / len(all_memory_usage) if all_memory_usage else 0
+                "avg_response_time_ms": response_time_sum / counted_tests if counted_tests else 0,
+                "avg_error_rate": error_rate_sum / counted_tests if counted_tests else 0,
+                "avg_cpu_usage": cpu_sum / counted_tests if counted_tests else 0,
+                "avg_memory_usage": memory_sum / counted_tests if counted_tests else 0
             },
             "recent_tests": [
                 {
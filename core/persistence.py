@@ -1,11 +1,17 @@
 """State persistence and management for the Discord bot."""
 
-import json
+import filecmp
+import heapq
 import logging
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
+import msgspec
+import orjson
+
 from .config import settings
 from .types import BotState, LeadersData
 
@@ -26,6 +32,14 @@ class StateManager:
             self.state_path = Path("/tmp/data") / self.state_path.name
             self.state_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # In-memory canonical copy of the last loaded/saved state; lets
+        # update methods skip the disk read-modify-write cycle
+        self._state: Optional[BotState] = None
+
+        # Most recent backup written by this manager, used to skip backups
+        # whose content would be identical
+        self._last_backup_path: Optional[Path] = None
+
     def load_state(self) -> BotState:
         """
         Load bot state from file.
@@ -38,12 +52,13 @@ class StateManager:
                 logger.info("No existing state file found, creating default state")
                 return BotState()
 
-            with open(self.state_path, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.state_path, "rb") as f:
+                data = orjson.loads(f.read())
 
-            # Convert to BotState
-            state = BotState(**data)
+            # Convert to BotState (extra keys like _metadata are ignored)
+            state = msgspec.convert(data, type=BotState)
             logger.info(f"Loaded state from {self.state_path}")
+            self._state = state
             return state
 
         except Exception as e:
@@ -51,6 +66,12 @@ class StateManager:
             logger.info("Creating default state due to load failure")
             return BotState()
 
+    def _cached_state(self) -> BotState:
+        """Return the in-memory state, loading from disk only on first use."""
+        if self._state is None:
+            self._state = self.load_state()
+        return self._state
+
     def save_state(self, state: BotState) -> bool:
         """
         Save bot state to file with atomic write.
@@ -62,8 +83,9 @@ class StateManager:
             True if save was successful, False otherwise
         """
         try:
-            # Convert to dict for JSON serialization
-            state_dict = state.dict()
+            # Serialize through msgspec: one C pass from structs to
+            # JSON-ready builtins for orjson
+            state_dict = msgspec.to_builtins(state)
 
             # Add metadata
             state_dict["_metadata"] = {
@@ -71,14 +93,33 @@ class StateManager:
                 "version": "1.0",
             }
 
-            # Write to temporary file first
+            # Write to temporary file first and flush it to stable storage
             temp_path = self.state_path.with_suffix(".tmp")
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(state_dict, f, indent=2, ensure_ascii=False)
-
-            # Atomic move
-            temp_path.replace(self.state_path)
-
+            payload = orjson.dumps(state_dict, option=orjson.OPT_INDENT_2)
+            # The payload is already one contiguous bytes object, so write
+            # unbuffered: one syscall, no copy into a BufferedWriter
+            with open(temp_path, "wb", buffering=0) as f:
+                f.write(payload)
+                if hasattr(os, "fdatasync"):
+                    os.fdatasync(f.fileno())
+                else:  # Platforms without fdatasync (e.g. Windows)
+                    os.fsync(f.fileno())
+
+            # Atomic rename, then sync the directory entry so the rename
+            # itself survives a crash
+            os.replace(temp_path, self.state_path)
+            try:
+                dir_fd = os.open(self.state_path.parent, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                # Directory fsync is not supported everywhere; the rename is
+                # still atomic, just not guaranteed durable
+                pass
+
+            self._state = state
             logger.info(f"State saved to {self.state_path}")
             return True
 
@@ -97,7 +138,7 @@ class StateManager:
             True if update was successful
         """
         try:
-            state = self.load_state()
+            state = self._cached_state()
             state.last_leaders = leaders
             return self.save_state(state)
         except Exception as e:
@@ -120,7 +161,7 @@ class StateManager:
             True if update was successful
         """
         try:
-            state = self.load_state()
+            state = self._cached_state()
             state.last_totals = last_totals
             state.milestones_sent = milestones_sent
             return self.save_state(state)
@@ -135,7 +176,7 @@ class StateManager:
         Returns:
             LeadersData instance
         """
-        state = self.load_state()
+        state = self._cached_state()
         return state.last_leaders
 
     def get_milestone_state(
@@ -147,7 +188,7 @@ class StateManager:
         Returns:
             Tuple of (last_totals, milestones_sent)
         """
-        state = self.load_state()
+        state = self._cached_state()
         return state.last_totals, state.milestones_sent
 
     def backup_state(self, backup_dir: Optional[str] = None) -> bool:
@@ -168,13 +209,30 @@ class StateManager:
             backup_dir = Path(backup_dir or self.state_path.parent)
             backup_dir.mkdir(parents=True, exist_ok=True)
 
+            # Skip the copy entirely when nothing changed since the last backup
+            if (
+                self._last_backup_path is not None
+                and self._last_backup_path.exists()
+                and filecmp.cmp(self.state_path, self._last_backup_path, shallow=False)
+            ):
+                logger.debug("State unchanged since last backup, skipping")
+                return True
+
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = backup_dir / f"state_backup_{timestamp}.json"
 
-            # Copy current state to backup
-            with open(self.state_path, encoding="utf-8") as src:
-                with open(backup_path, "w", encoding="utf-8") as dst:
-                    dst.write(src.read())
+            # Same-second backups collide on the timestamp name; if the
+            # existing file already matches there is nothing to do
+            if backup_path.exists() and filecmp.cmp(
+                self.state_path, backup_path, shallow=False
+            ):
+                self._last_backup_path = backup_path
+                return True
+
+            # Copy current state to backup (zero-copy fast path where the
+            # platform supports it, C-level buffered loop elsewhere)
+            shutil.copyfile(self.state_path, backup_path)
+            self._last_backup_path = backup_path
 
             logger.info(f"State backed up to {backup_path}")
             return True
@@ -201,17 +259,26 @@ class StateManager:
             if not backup_dir.exists():
                 return True
 
-            # Find all backup files
-            backup_files = list(backup_dir.glob("state_backup_*.json"))
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
-            # Remove old backups
-            for backup_file in backup_files[keep_count:]:
-                backup_file.unlink()
+            # Find all backup files; scandir gives each entry's stat once,
+            # instead of one stat syscall per sort-key evaluation
+            with os.scandir(backup_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.startswith("state_backup_")
+                    and entry.name.endswith(".json")
+                ]
+
+            # Remove everything but the keep_count newest; nsmallest avoids a
+            # full sort when keep_count is much smaller than the backlog
+            for _, backup_file in heapq.nsmallest(
+                max(len(entries) - keep_count, 0), entries
+            ):
+                os.unlink(backup_file)
                 logger.debug(f"Removed old backup: {backup_file}")
 
             logger.info(
-                f"Cleaned up old backups, keeping {min(keep_count, len(backup_files))} recent ones"
+                f"Cleaned up old backups, keeping {min(keep_count, len(entries))} recent ones"
             )
             return True
 
@@ -1,37 +1,106 @@
 """Player ranking system for calculating league-wide rankings."""
 
+import asyncio
+import heapq
 import logging
+import time
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from operator import attrgetter
+
+import numpy as np
 
 from .config import settings
 from .http import HTTPClient
 
 logger = logging.getLogger(__name__)
 
+# Stat fields ranked by calculate_rankings, in matrix column order
+_STAT_FIELDS = (
+    "points", "assists", "rebounds", "steals", "blocks", "threes_made",
+    "ppg", "apg", "rpg", "spg", "bpg", "threep_percent"
+)
+
+# League-wide rankings are expensive (N player fetches + 12 sorts), so the
+# computed table is memoized for a few minutes and per-player lookups hit
+# the cached dict instead
+_RANKINGS_TTL_SECONDS = 300
+_rankings_cache: Optional[Tuple[float, Dict[int, Dict[str, int]]]] = None
+
+# Single-flight guard for the recompute: concurrent lookups on a cold or
+# expired cache wait for one fetch instead of each launching their own.
+# Created lazily so it binds to the running loop (pre-3.10 asyncio).
+_rankings_lock: Optional[asyncio.Lock] = None
+
+# C-level extractor pulling all ranked stats from a player in one call
+_STAT_GETTER = attrgetter(*_STAT_FIELDS)
+
+# Raw totals parsed from SportsPress statistics payloads; index order is the
+# slot each total occupies while accumulating (ppg/apg/... derive from the
+# first five)
+_TOTAL_FIELDS = (
+    "points", "assists", "rebounds", "steals", "blocks", "threes_made",
+    "fgm", "fga", "threepm", "threepa", "games_played"
+)
+_TOTAL_INDEX = {name: slot for slot, name in enumerate(_TOTAL_FIELDS)}
+
 
-@dataclass
 class PlayerRanking:
-    """Player ranking data."""
-    player_id: int
-    player_name: str
-    points: float = 0.0
-    assists: float = 0.0
-    rebounds: float = 0.0
-    steals: float = 0.0
-    blocks: float = 0.0
-    threes_made: float = 0.0
-    fgm: float = 0.0
-    fga: float = 0.0
-    threepm: float = 0.0
-    threepa: float = 0.0
-    games_played: int = 0
-    ppg: float = 0.0
-    apg: float = 0.0
-    rpg: float = 0.0
-    spg: float = 0.0
-    bpg: float = 0.0
-    threep_percent: float = 0.0
+    """Player ranking data.
+
+    Slotted by hand rather than via ``@dataclass(slots=True)`` (3.10+): with
+    ~17 numeric fields per player, dropping the per-instance ``__dict__``
+    roughly triples how many rankings fit in the same working set and makes
+    each attribute read a fixed slot load.
+    """
+
+    __slots__ = (
+        "player_id", "player_name", "points", "assists", "rebounds",
+        "steals", "blocks", "threes_made", "fgm", "fga", "threepm",
+        "threepa", "games_played", "ppg", "apg", "rpg", "spg", "bpg",
+        "threep_percent",
+    )
+
+    def __init__(
+        self,
+        player_id: int,
+        player_name: str,
+        points: float = 0.0,
+        assists: float = 0.0,
+        rebounds: float = 0.0,
+        steals: float = 0.0,
+        blocks: float = 0.0,
+        threes_made: float = 0.0,
+        fgm: float = 0.0,
+        fga: float = 0.0,
+        threepm: float = 0.0,
+        threepa: float = 0.0,
+        games_played: int = 0,
+        ppg: float = 0.0,
+        apg: float = 0.0,
+        rpg: float = 0.0,
+        spg: float = 0.0,
+        bpg: float = 0.0,
+        threep_percent: float = 0.0,
+    ):
+        self.player_id = player_id
+        self.player_name = player_name
+        self.points = points
+        self.assists = assists
+        self.rebounds = rebounds
+        self.steals = steals
+        self.blocks = blocks
+        self.threes_made = threes_made
+        self.fgm = fgm
+        self.fga = fga
+        self.threepm = threepm
+        self.threepa = threepa
+        self.games_played = games_played
+        self.ppg = ppg
+        self.apg = apg
+        self.rpg = rpg
+        self.spg = spg
+        self.bpg = bpg
+        self.threep_percent = threep_percent
 
 
 async def get_all_player_rankings(client: HTTPClient) -> List[PlayerRanking]:
@@ -47,17 +116,28 @@ async def get_all_player_rankings(client: HTTPClient) -> List[PlayerRanking]:
     try:
         logger.info("Fetching all player rankings...")
         
-        # Get all players
+        # Get all players; pages can overlap if the dataset shifts mid-crawl,
+        # so guard with a seen-id set to avoid ranking anyone twice
         players = []
+        seen_ids = set()
         page = 1
         max_pages = 20  # Reasonable limit
-        
+
         while page <= max_pages:
-            url = f"{settings.SPORTSPRESS_BASE}/players?per_page=100&page={page}"
+            # Request the statistics block inline so ranking the league costs
+            # one request per page instead of one request per player
+            url = (
+                f"{settings.SPORTSPRESS_BASE}/players"
+                f"?per_page=100&page={page}&_fields=id,title,statistics"
+            )
             try:
                 data = await client.get_json(url)
                 if isinstance(data, list) and len(data) > 0:
-                    players.extend(data)
+                    for player in data:
+                        player_id = player.get("id")
+                        if player_id and player_id not in seen_ids:
+                            seen_ids.add(player_id)
+                            players.append(player)
                     logger.info(f"Fetched page {page}: {len(data)} players")
                     page += 1
                 else:
@@ -68,32 +148,37 @@ async def get_all_player_rankings(client: HTTPClient) -> List[PlayerRanking]:
         
         logger.info(f"Total players fetched: {len(players)}")
         
-        # Process each player's statistics
-        player_rankings = []
-        
-        for player in players:
+        # Fetch each player's statistics concurrently; the HTTP client's own
+        # semaphore keeps the number of in-flight requests bounded
+        async def build_ranking(player) -> Optional[PlayerRanking]:
             try:
                 player_id = player.get("id")
                 player_name = player.get("title", {}).get("rendered", "Unknown")
-                
+
                 if not player_id:
-                    continue
-                
-                # Get player statistics
-                player_stats = await _get_player_statistics(client, player_id)
-                
+                    return None
+
+                # Use the statistics delivered with the list page when
+                # present; fall back to the per-player endpoint otherwise
+                if player.get("statistics"):
+                    player_stats = _parse_player_statistics(player)
+                else:
+                    player_stats = await _get_player_statistics(client, player_id)
+
                 if player_stats:
-                    ranking = PlayerRanking(
+                    return PlayerRanking(
                         player_id=player_id,
                         player_name=player_name,
                         **player_stats
                     )
-                    player_rankings.append(ranking)
-                    
+
             except Exception as e:
                 logger.warning(f"Error processing player {player.get('id', 'unknown')}: {e}")
-                continue
-        
+            return None
+
+        results = await asyncio.gather(*(build_ranking(player) for player in players))
+        player_rankings = [ranking for ranking in results if ranking is not None]
+
         logger.info(f"Processed {len(player_rankings)} player rankings")
         return player_rankings
         
@@ -107,54 +192,56 @@ async def _get_player_statistics(client: HTTPClient, player_id: int) -> Optional
     try:
         url = f"{settings.SPORTSPRESS_BASE}/players/{player_id}"
         player_data = await client.get_json(url)
-        
+
         if not player_data:
             return None
-        
-        # Initialize stats
-        stats = {
-            "points": 0.0,
-            "assists": 0.0,
-            "rebounds": 0.0,
-            "steals": 0.0,
-            "blocks": 0.0,
-            "threes_made": 0.0,
-            "fgm": 0.0,
-            "fga": 0.0,
-            "threepm": 0.0,
-            "threepa": 0.0,
-            "games_played": 0
-        }
-        
-        # Extract statistics from the player data
-        statistics = player_data.get("statistics", [])
-        if statistics:
-            for stat_group in statistics:
-                if isinstance(stat_group, dict):
-                    for stat_name, stat_value in stat_group.items():
-                        if stat_name in stats:
-                            try:
-                                stats[stat_name] += float(stat_value or 0)
-                            except (ValueError, TypeError):
-                                pass
-        
-        # Calculate per-game averages
+
+        return _parse_player_statistics(player_data)
+
+    except Exception as e:
+        logger.warning(f"Error getting statistics for player {player_id}: {e}")
+        return None
+
+
+def _parse_player_statistics(player_data: Dict) -> Optional[Dict]:
+    """Parse the statistics block of a player payload into totals/averages."""
+    try:
+        # Accumulate totals in a flat list addressed through the precompiled
+        # field index; one dict probe per incoming stat, no rebuilt dict of
+        # field names per player
+        totals = [0.0] * len(_TOTAL_FIELDS)
+        field_index = _TOTAL_INDEX.get
+
+        for stat_group in player_data.get("statistics", []) or []:
+            if isinstance(stat_group, dict):
+                for stat_name, stat_value in stat_group.items():
+                    slot = field_index(stat_name)
+                    if slot is not None:
+                        try:
+                            totals[slot] += float(stat_value or 0)
+                        except (ValueError, TypeError):
+                            pass
+
+        stats = dict(zip(_TOTAL_FIELDS, totals))
+
+        # Calculate per-game averages in one fold over the totals
         games_played = stats["games_played"]
         if games_played > 0:
-            stats["ppg"] = stats["points"] / games_played
-            stats["apg"] = stats["assists"] / games_played
-            stats["rpg"] = stats["rebounds"] / games_played
-            stats["spg"] = stats["steals"] / games_played
-            stats["bpg"] = stats["blocks"] / games_played
-            
+            per_game = 1.0 / games_played
+            stats["ppg"] = totals[0] * per_game
+            stats["apg"] = totals[1] * per_game
+            stats["rpg"] = totals[2] * per_game
+            stats["spg"] = totals[3] * per_game
+            stats["bpg"] = totals[4] * per_game
+
             # Calculate 3P%
             if stats["threepa"] > 0:
                 stats["threep_percent"] = (stats["threepm"] / stats["threepa"]) * 100
-        
+
         return stats
-        
+
     except Exception as e:
-        logger.warning(f"Error getting statistics for player {player_id}: {e}")
+        logger.warning(f"Error parsing statistics for player {player_data.get('id', 'unknown')}: {e}")
         return None
 
 
@@ -168,33 +255,72 @@ def calculate_rankings(player_rankings: List[PlayerRanking]) -> Dict[int, Dict[s
     Returns:
         Dictionary mapping player_id to their rankings for each stat
     """
-    rankings = {}
-    
-    # Define stat fields to rank
-    stat_fields = [
-        "points", "assists", "rebounds", "steals", "blocks", "threes_made",
-        "ppg", "apg", "rpg", "spg", "bpg", "threep_percent"
-    ]
-    
-    for field in stat_fields:
-        # Sort players by this stat (descending for most stats, ascending for some)
-        reverse = field not in ["bpg"]  # Blocks per game might be better ascending
-        
-        sorted_players = sorted(
-            player_rankings,
-            key=lambda p: getattr(p, field, 0),
-            reverse=reverse
-        )
-        
-        # Assign rankings
-        for rank, player in enumerate(sorted_players, 1):
-            if player.player_id not in rankings:
-                rankings[player.player_id] = {}
-            rankings[player.player_id][field] = rank
-    
+    rankings: Dict[int, Dict[str, int]] = {}
+
+    if not player_rankings:
+        return rankings
+
+    # Stats-of-arrays matrix (players x stats): one C-level argsort per column
+    # replaces twelve Python sorts with per-element lambda key calls
+    matrix = np.array(
+        [_STAT_GETTER(p) for p in player_rankings],
+        dtype=np.float64,
+    )
+
+    # Descending for most stats, ascending for bpg (as before); stable sort
+    # keeps tie ordering identical to the previous sorted() behavior
+    order = np.argsort(-matrix, axis=0, kind="stable")
+    bpg_column = _STAT_FIELDS.index("bpg")
+    order[:, bpg_column] = np.argsort(matrix[:, bpg_column], kind="stable")
+
+    # Scatter ranks back: the player at sorted position r gets rank r+1
+    positions = np.arange(1, len(player_rankings) + 1).reshape(-1, 1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.broadcast_to(positions, order.shape), axis=0)
+
+    # Materialize dicts only at this API boundary: one C-level tolist()
+    # converts the whole matrix to Python ints, then each row zips straight
+    # against the field tuple — no per-cell indexing or int() calls
+    rank_rows = ranks.tolist()
+    for player, row in zip(player_rankings, rank_rows):
+        rankings[player.player_id] = dict(zip(_STAT_FIELDS, row))
+
     return rankings
 
 
+def top_k_per_stat(
+    player_rankings: List[PlayerRanking], k: int = 10
+) -> Dict[str, List[PlayerRanking]]:
+    """
+    Get the top-k players for each ranked stat.
+
+    Leaderboard displays only consume the first handful of players, so this
+    runs one O(N log k) heap selection per stat instead of the full O(N log N)
+    sort that calculate_rankings needs for per-player ranks.
+
+    Args:
+        player_rankings: List of player ranking data
+        k: Number of players to keep per stat
+
+    Returns:
+        Dictionary mapping stat field to its top-k players, best first
+    """
+    leaders: Dict[str, List[PlayerRanking]] = {}
+
+    for field in _STAT_FIELDS:
+        # bpg ranks ascending in calculate_rankings; mirror that here
+        select = heapq.nsmallest if field == "bpg" else heapq.nlargest
+        leaders[field] = select(k, player_rankings, key=attrgetter(field))
+
+    return leaders
+
+
+def invalidate_rankings_cache() -> None:
+    """Drop the cached rankings table so the next lookup recomputes it."""
+    global _rankings_cache
+    _rankings_cache = None
+
+
 async def get_player_rankings(client: HTTPClient, player_id: int) -> Dict[str, int]:
     """
     Get rankings for a specific player.
@@ -206,19 +332,36 @@ async def get_player_rankings(client: HTTPClient, player_id: int) -> Dict[str, i
     Returns:
         Dictionary of stat rankings for the player
     """
+    global _rankings_cache, _rankings_lock
+
     try:
-        # Get all player rankings
-        all_rankings = await get_all_player_rankings(client)
-        
-        if not all_rankings:
-            return {}
-        
-        # Calculate rankings
-        rankings_dict = calculate_rankings(all_rankings)
-        
+        # Serve from the cached table while it is fresh
+        now = time.monotonic()
+        if _rankings_cache and now - _rankings_cache[0] < _RANKINGS_TTL_SECONDS:
+            return _rankings_cache[1].get(player_id, {})
+
+        if _rankings_lock is None:
+            _rankings_lock = asyncio.Lock()
+
+        async with _rankings_lock:
+            # Another caller may have finished the recompute while we waited
+            now = time.monotonic()
+            if _rankings_cache and now - _rankings_cache[0] < _RANKINGS_TTL_SECONDS:
+                return _rankings_cache[1].get(player_id, {})
+
+            # Get all player rankings
+            all_rankings = await get_all_player_rankings(client)
+
+            if not all_rankings:
+                return {}
+
+            # Calculate rankings
+            rankings_dict = calculate_rankings(all_rankings)
+            _rankings_cache = (now, rankings_dict)
+
         # Return rankings for the specific player
         return rankings_dict.get(player_id, {})
-        
+
     except Exception as e:
         logger.error(f"Error getting player rankings: {e}")
         return {}
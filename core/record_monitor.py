@@ -1,23 +1,71 @@
 """Record monitoring system for Discord notifications."""
 
 import asyncio
-import json
 import logging
+import random
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Optional
 
 import discord
+import msgspec
+import orjson
 
 from .config import settings
 from .records import RecordsData, SingleGameRecord
 from .http import HTTPClient
+from .rankings import invalidate_rankings_cache
 
 logger = logging.getLogger(__name__)
 
 # File to store previous records for comparison
 RECORDS_FILE = Path("data/previous_records.json")
 
+# Cache validators (ETag / Last-Modified) from the last events fetch, kept
+# next to the records snapshot so conditional GETs survive restarts
+CACHE_TOKEN_FILE = Path("data/previous_records.etag")
+
+# Embed dressing per record category, frozen at import so notification
+# sends don't rebuild the same dicts for every record
+_STAT_EMOJIS = MappingProxyType({
+    'points': '🏀',
+    'rebounds': '📊',
+    'assists': '🎯',
+    'steals': '🦹',
+    'blocks': '🛡️',
+    'threes_made': '🎯',
+    'fg_percent': '🎯',
+    'threep_percent': '🎯',
+})
+
+_STAT_UNITS = MappingProxyType({
+    'points': 'pts',
+    'rebounds': 'reb',
+    'assists': 'ast',
+    'steals': 'stl',
+    'blocks': 'blk',
+    'threes_made': '3PM',
+    'fg_percent': '%',
+    'threep_percent': '%',
+})
+
+# Fully-formatted field titles, precomputed per category
+_STAT_FIELD_NAMES = MappingProxyType({
+    stat: f"{_STAT_EMOJIS[stat]} {stat.title()} Record" for stat in _STAT_EMOJIS
+})
+
+# Record categories compared on every monitor tick, paired with C-level
+# extractors so the comparison loop avoids per-iteration getattr calls
+_RECORD_FIELDS = tuple(
+    (name, attrgetter(name))
+    for name in (
+        "points", "rebounds", "assists", "steals", "blocks",
+        "threes_made", "threep_percent",
+    )
+)
+
 
 class RecordMonitor:
     """Monitors for new records and sends Discord notifications."""
@@ -26,6 +74,8 @@ class RecordMonitor:
         self.bot = bot
         self.http_client = http_client
         self.previous_records: Optional[RecordsData] = None
+        self._cache_validators: Dict[str, str] = {}
+        self._fail_count = 0
         self._ensure_data_dir()
     
     def _ensure_data_dir(self):
@@ -36,22 +86,67 @@ class RecordMonitor:
         """Load previous records from file."""
         try:
             if RECORDS_FILE.exists():
-                with open(RECORDS_FILE, 'r') as f:
-                    data = json.load(f)
-                    return RecordsData(**data)
+                # File I/O would block the event loop; read in a worker thread
+                data = orjson.loads(await asyncio.to_thread(RECORDS_FILE.read_bytes))
+                return msgspec.convert(data, type=RecordsData)
         except Exception as e:
             logger.warning(f"Failed to load previous records: {e}")
         return None
-    
+
     async def save_current_records(self, records: RecordsData):
         """Save current records to file."""
         try:
-            with open(RECORDS_FILE, 'w') as f:
-                json.dump(records.dict(), f, indent=2)
+            # Compact encoding: this file is only read back by the monitor,
+            # so pretty-printing just inflated write size
+            payload = msgspec.json.encode(records)
+            await asyncio.to_thread(RECORDS_FILE.write_bytes, payload)
         except Exception as e:
             logger.error(f"Failed to save current records: {e}")
     
-    def _compare_records(self, old_record: Optional[SingleGameRecord], 
+    async def _events_unchanged(self) -> bool:
+        """Probe the events endpoint with a conditional GET.
+
+        Returns True only when the server answers 304 Not Modified for the
+        first events page, meaning the full record recomputation can be
+        skipped this tick. Any error or missing validator counts as changed.
+        """
+        if not self._cache_validators:
+            try:
+                if CACHE_TOKEN_FILE.exists():
+                    self._cache_validators = orjson.loads(
+                        await asyncio.to_thread(CACHE_TOKEN_FILE.read_bytes)
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to load cache validators: {e}")
+
+        headers = {}
+        if self._cache_validators.get("etag"):
+            headers["If-None-Match"] = self._cache_validators["etag"]
+        if self._cache_validators.get("last_modified"):
+            headers["If-Modified-Since"] = self._cache_validators["last_modified"]
+
+        url = f"{settings.SPORTSPRESS_BASE}/events?per_page=1&page=1"
+        try:
+            async with self.http_client.session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return True
+                if response.status == 200:
+                    validators = {}
+                    if response.headers.get("ETag"):
+                        validators["etag"] = response.headers["ETag"]
+                    if response.headers.get("Last-Modified"):
+                        validators["last_modified"] = response.headers["Last-Modified"]
+                    if validators != self._cache_validators:
+                        self._cache_validators = validators
+                        if validators:
+                            await asyncio.to_thread(
+                                CACHE_TOKEN_FILE.write_bytes, orjson.dumps(validators)
+                            )
+        except Exception as e:
+            logger.warning(f"Conditional events probe failed: {e}")
+        return False
+
+    def _compare_records(self, old_record: Optional[SingleGameRecord],
                         new_record: Optional[SingleGameRecord]) -> bool:
         """Compare two records to see if a new record was set."""
         if not old_record and new_record:
@@ -67,14 +162,16 @@ class RecordMonitor:
         if not self.previous_records:
             logger.info("No previous records to compare against")
             return new_records
-        
-        # List of record types to check
-        record_types = ['points', 'rebounds', 'assists', 'steals', 'blocks', 
-                       'threes_made', 'threep_percent']
-        
-        for record_type in record_types:
-            old_record = getattr(self.previous_records, record_type, None)
-            new_record = getattr(current_records, record_type, None)
+
+        # Cold start / upstream outage leaves every category None; bail
+        # before the per-category comparisons
+        if not any(get_record(current_records) for _, get_record in _RECORD_FIELDS):
+            logger.debug("Current records are empty, nothing to compare")
+            return new_records
+
+        for record_type, get_record in _RECORD_FIELDS:
+            old_record = get_record(self.previous_records)
+            new_record = get_record(current_records)
             
             if self._compare_records(old_record, new_record):
                 new_records.append({
@@ -111,33 +208,10 @@ class RecordMonitor:
                 )
                 
                 # Add record details
-                stat_emojis = {
-                    'points': '🏀',
-                    'rebounds': '📊', 
-                    'assists': '🎯',
-                    'steals': '🦹',
-                    'blocks': '🛡️',
-                    'threes_made': '🎯',
-                    'fg_percent': '🎯',
-                    'threep_percent': '🎯'
-                }
-                
-                stat_units = {
-                    'points': 'pts',
-                    'rebounds': 'reb',
-                    'assists': 'ast', 
-                    'steals': 'stl',
-                    'blocks': 'blk',
-                    'threes_made': '3PM',
-                    'fg_percent': '%',
-                    'threep_percent': '%'
-                }
-                
-                emoji = stat_emojis.get(record_type, '🏆')
-                unit = stat_units.get(record_type, '')
-                
+                unit = _STAT_UNITS.get(record_type, '')
+
                 embed.add_field(
-                    name=f"{emoji} {record_type.title()} Record",
+                    name=_STAT_FIELD_NAMES.get(record_type, f"🏆 {record_type.title()} Record"),
                     value=f"**{new_record.value:.1f}{unit}** by **{new_record.holder}**\n"
                           f"Game: {new_record.game}\n"
                           f"Date: {new_record.date}\n"
@@ -174,7 +248,14 @@ class RecordMonitor:
             try:
                 # Import here to avoid circular imports
                 from .records import compute_single_game_records, resolve_record_names
-                
+
+                # When the server says the events feed hasn't changed since
+                # the last crawl, skip the whole recomputation this tick
+                if self.previous_records and await self._events_unchanged():
+                    logger.info("Events unchanged since last check, skipping tick")
+                    await asyncio.sleep(1800)
+                    continue
+
                 # Compute current records
                 current_records = await compute_single_game_records(self.http_client)
                 if current_records:
@@ -183,21 +264,39 @@ class RecordMonitor:
                     
                     # Check for new records
                     new_records = await self.check_for_new_records(current_records)
-                    
+
                     # Send notifications if there are new records
                     if new_records:
                         await self.send_record_notification(new_records)
-                    
-                    # Save current records as previous for next check
-                    await self.save_current_records(current_records)
+
+                    # The in-memory copy is canonical between ticks; the
+                    # snapshot file only exists to survive restarts, so hit
+                    # disk just on first load and when a record changed
+                    if new_records or self.previous_records is None:
+                        await self.save_current_records(current_records)
                     self.previous_records = current_records
-                
+
+                    # The events feed changed, so the cached rankings table
+                    # is stale too; force a recompute on the next lookup
+                    invalidate_rankings_cache()
+
+                self._fail_count = 0
+
                 # Wait before next check (check every 30 minutes)
                 await asyncio.sleep(1800)  # 30 minutes
-                
+
             except Exception as e:
-                logger.error(f"Error in record monitoring: {e}")
-                await asyncio.sleep(300)  # Wait 5 minutes before retrying
+                # Back off exponentially with jitter instead of hammering a
+                # struggling API at a fixed rate; previous_records is left
+                # untouched so recovery picks up where we stopped
+                delay = min(300, 5 * 2 ** self._fail_count)
+                delay += random.uniform(0, delay * 0.1)
+                self._fail_count += 1
+                logger.error(
+                    f"Error in record monitoring (attempt {self._fail_count}): {e}; "
+                    f"retrying in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
 
 
 async def start_record_monitor(bot: discord.ext.commands.Bot, http_client: HTTPClient):
@@ -1,22 +1,157 @@
 """Single-game records computation from SportsPress events."""
 
+import asyncio
+import heapq
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import msgspec
+import orjson
 
 from .config import settings
 from .http import HTTPClient
 from .sportspress import _extract_rows_from_event, fetch_events
 from .types import RecordsData, SingleGameRecord, DoubleDouble, TripleDouble
-from .names import get_player_name, get_team_name, get_player_url
+from .names import get_player_name, get_team_name, get_player_url, prefetch_players, prefetch_teams
 from .utils import format_number, get_league_colors, create_branded_footer
 
 logger = logging.getLogger(__name__)
 
+# Disk cache for event pages keyed by URL. Historical events never change,
+# so conditional GETs let the server answer 304 for almost every page and
+# we reuse the cached body without re-downloading or re-parsing it.
+_EVENTS_CACHE_FILE = Path("data/events_cache.json")
+# Bound on persisted entries; least recently used pages are evicted so the
+# cache file stays a fixed size no matter how long the bot runs
+_EVENTS_CACHE_MAX = 256
+_events_cache: Optional["OrderedDict[str, Dict[str, Any]]"] = None
+
+
+def _load_events_cache() -> "OrderedDict[str, Dict[str, Any]]":
+    """Load the on-disk events cache once per process."""
+    global _events_cache
+    if _events_cache is None:
+        _events_cache = OrderedDict()
+        try:
+            if _EVENTS_CACHE_FILE.exists():
+                _events_cache = OrderedDict(
+                    orjson.loads(_EVENTS_CACHE_FILE.read_bytes())
+                )
+        except Exception as e:
+            logger.warning(f"Failed to load events cache: {e}")
+    return _events_cache
+
+
+def _save_events_cache() -> None:
+    """Persist the events cache; best effort, the cache is only an optimization."""
+    if _events_cache is None:
+        return
+    try:
+        _EVENTS_CACHE_FILE.parent.mkdir(exist_ok=True)
+        _EVENTS_CACHE_FILE.write_bytes(orjson.dumps(_events_cache))
+    except Exception as e:
+        logger.warning(f"Failed to save events cache: {e}")
+
 
-@dataclass
-class RecordCandidate:
-    """Candidate for a single-game record."""
+# Aggregated records from the last successful crawl plus the time the crawl
+# started. Records are monotone maxima, so a rerun only needs the events
+# modified since then folded into the cached aggregate.
+_RECORDS_AGGREGATE_FILE = Path("data/records_aggregate.json")
+
+
+def _load_records_aggregate() -> Optional[Tuple[RecordsData, str]]:
+    """Load the persisted aggregate, or None for a full scan."""
+    try:
+        if _RECORDS_AGGREGATE_FILE.exists():
+            payload = orjson.loads(_RECORDS_AGGREGATE_FILE.read_bytes())
+            return (
+                msgspec.convert(payload["records"], type=RecordsData),
+                payload["last_run"],
+            )
+    except Exception as e:
+        logger.warning(f"Failed to load records aggregate: {e}")
+    return None
+
+
+def _save_records_aggregate(records: RecordsData, run_started: str) -> None:
+    """Persist the aggregate; best effort, a lost file just means a full scan."""
+    try:
+        _RECORDS_AGGREGATE_FILE.parent.mkdir(exist_ok=True)
+        _RECORDS_AGGREGATE_FILE.write_bytes(
+            orjson.dumps(
+                {"last_run": run_started, "records": msgspec.to_builtins(records)}
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Failed to save records aggregate: {e}")
+
+
+async def _cached_get_json(
+    client: HTTPClient, url: str
+) -> Tuple[Optional[Any], Dict[str, str]]:
+    """
+    GET a URL through the conditional-request cache.
+
+    Returns:
+        Tuple of (parsed body or None, selected response headers). On a 304
+        the cached body and headers are returned without re-parsing.
+    """
+    cache = _load_events_cache()
+    # Incremental URLs embed the per-run modified_after timestamp, so they
+    # never recur: caching those bodies would only fill the file with dead
+    # entries that can never produce a 304 hit
+    cacheable = "modified_after=" not in url
+    entry = cache.get(url) if cacheable else None
+
+    request_headers = {}
+    if entry:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    async with client.session.get(url, headers=request_headers) as response:
+        if response.status == 304 and entry is not None:
+            cache.move_to_end(url)
+            return entry.get("body"), entry.get("headers", {})
+        if response.status == 200:
+            # orjson decodes the raw bytes directly, skipping both aiohttp's
+            # stdlib json parse and the intermediate str decode
+            data = orjson.loads(await response.read())
+            kept_headers = {
+                name: response.headers[name]
+                for name in ("X-WP-Total", "X-WP-TotalPages")
+                if name in response.headers
+            }
+            if cacheable and (
+                response.headers.get("ETag") or response.headers.get("Last-Modified")
+            ):
+                cache[url] = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "headers": kept_headers,
+                    "body": data,
+                }
+                cache.move_to_end(url)
+                while len(cache) > _EVENTS_CACHE_MAX:
+                    cache.popitem(last=False)
+            return data, kept_headers
+        if response.status != 400:  # 400 = past last page
+            logger.warning(f"GET {url}: HTTP {response.status}")
+    return None, {}
+
+
+class RecordCandidate(NamedTuple):
+    """Candidate for a single-game record.
+
+    A NamedTuple rather than a dataclass: no per-instance __dict__, C-level
+    construction, and candidates are never mutated after creation.
+    """
 
     stat: str
     value: float
@@ -66,74 +201,195 @@ def _try_update_max(
     return current
 
 
-def _check_double_triple_doubles(
-    records: RecordsData, 
-    row: Any, 
-    player_id: Optional[int], 
-    team_id: Optional[int], 
-    opp_team_id: Optional[int], 
-    game_url: Optional[str]
+# Counting stats scanned by the hot row loop in compute_single_game_records;
+# attribute names match between EventPlayerRow and RecordsData
+_MAX_STAT_FIELDS = (
+    "points", "rebounds", "assists", "steals", "blocks", "threes_made",
+)
+
+
+def _record_from_row(stat: str, value: float, row: Any) -> SingleGameRecord:
+    """Build a SingleGameRecord for the winning row of one stat column."""
+    return SingleGameRecord(
+        stat=stat,
+        value=value,
+        holder=row.name,
+        game=row.game,
+        date=row.date,
+        player_id=row.player_id or None,
+        team_id=row.team_id or None,
+        opp_team_id=row.opp_team_id or None,
+        game_url=row.game_url or None,
+    )
+
+
+# Categories counted toward double/triple-doubles, in display order
+_DOUBLE_STATS = ("points", "rebounds", "assists", "steals", "blocks")
+
+# Embed layout per record stat: (attribute, display name, unit)
+_STAT_CONFIGS = (
+    ("points", "🏀 Points", "pts"),
+    ("rebounds", "📊 Rebounds", "reb"),
+    ("assists", "🎯 Assists", "ast"),
+    ("steals", "🦹 Steals", "stl"),
+    ("blocks", "🛡️ Blocks", "blk"),
+    ("threes_made", "🎯 3-Pointers Made", "3PM"),
+    ("threep_percent", "🎯 3P%", "%"),
+)
+
+# Pre-titled category names so embed rendering skips per-row str.title()
+_CAT_TITLES = {stat: stat.title() for stat in _DOUBLE_STATS}
+
+
+def _detect_double_triple_doubles(
+    records: RecordsData,
+    rows: List[Any],
+    stat_matrix: Optional[np.ndarray] = None,
 ) -> None:
     """
-    Check if a player achieved a double-double or triple-double in a game.
-    
+    Detect double-doubles and triple-doubles across all rows at once.
+
+    The five counting columns are stacked into one (N, 5) matrix so the 10+
+    threshold test and the per-row category count run as two vectorized
+    passes; only the few positive rows pay Python-object construction.
+
     Args:
         records: Records data to update
-        row: Player row data from event
-        player_id: Player ID
-        team_id: Team ID
-        opp_team_id: Opponent team ID
-        game_url: Game URL
+        rows: Flattened player rows from all events
+        stat_matrix: Optional precomputed (N, 5) matrix in _DOUBLE_STATS
+            column order, reused from the max scan when available
     """
-    # Define the stats to check for double-doubles/triple-doubles
-    stats_to_check = {
-        "points": row.points,
-        "rebounds": row.rebounds,
-        "assists": row.assists,
-        "steals": row.steals,
-        "blocks": row.blocks
+    count = len(rows)
+    if stat_matrix is None:
+        stat_matrix = np.stack(
+            [
+                np.fromiter((getattr(row, stat) for row in rows), np.float64, count)
+                for stat in _DOUBLE_STATS
+            ],
+            axis=1,
+        )
+    double_digit = stat_matrix >= 10
+    category_counts = double_digit.sum(axis=1)
+
+    # A modified event can be re-scanned on an incremental run; skip entries
+    # the aggregate already holds
+    seen = {
+        (entry.player_id or entry.player, entry.date, entry.game)
+        for entry in (*records.double_doubles, *records.triple_doubles)
     }
-    
-    # Find categories where player achieved 10+
-    double_digit_categories = []
-    values = {}
-    
-    for stat, value in stats_to_check.items():
-        if value >= 10:
-            double_digit_categories.append(stat)
-            values[stat] = value
-    
-    # Check for triple-double (3+ categories with 10+)
-    if len(double_digit_categories) >= 3:
-        triple_double = TripleDouble(
+
+    for idx in np.nonzero(category_counts >= 2)[0]:
+        row = rows[idx]
+        key = (row.player_id or row.name, row.date, row.game)
+        if key in seen:
+            continue
+        seen.add(key)
+        categories = []
+        values = {}
+        for column, stat in enumerate(_DOUBLE_STATS):
+            if double_digit[idx, column]:
+                categories.append(stat)
+                values[stat] = float(stat_matrix[idx, column])
+
+        entry_kwargs = dict(
             player=row.name,
             game=row.game,
             date=row.date,
-            categories=double_digit_categories,
+            categories=categories,
             values=values,
-            player_id=player_id,
-            team_id=team_id,
-            opp_team_id=opp_team_id,
-            game_url=game_url
+            player_id=row.player_id,
+            team_id=row.team_id,
+            opp_team_id=row.opp_team_id,
+            game_url=row.game_url,
         )
-        records.triple_doubles.append(triple_double)
-        logger.debug(f"Triple-double detected: {row.name} - {double_digit_categories}")
-    
-    # Check for double-double (2+ categories with 10+)
-    elif len(double_digit_categories) >= 2:
-        double_double = DoubleDouble(
-            player=row.name,
-            game=row.game,
-            date=row.date,
-            categories=double_digit_categories,
-            values=values,
-            player_id=player_id,
-            team_id=team_id,
-            opp_team_id=opp_team_id,
-            game_url=game_url
+        if len(categories) >= 3:
+            records.triple_doubles.append(TripleDouble(**entry_kwargs))
+            logger.debug(f"Triple-double detected: {row.name} - {categories}")
+        else:
+            records.double_doubles.append(DoubleDouble(**entry_kwargs))
+            logger.debug(f"Double-double detected: {row.name} - {categories}")
+
+
+def _scan_events(records: RecordsData, events: List[Dict[str, Any]]) -> None:
+    """
+    Fold all events into the records aggregate.
+
+    Pure CPU, no awaits: compute_single_game_records runs this in a worker
+    thread so the scan doesn't stall the event loop.
+
+    Args:
+        records: Records data updated in place
+        events: Raw event payloads to scan
+    """
+    # Flatten every event into one row list, then find each record with
+    # a vectorized column scan instead of per-row Python comparisons
+    all_rows = []
+    for event in events:
+        try:
+            all_rows.extend(_extract_rows_from_event(event))
+        except Exception as e:
+            logger.warning(f"Failed to process event: {e}")
+            continue
+
+    if all_rows:
+        count = len(all_rows)
+        columns: Dict[str, np.ndarray] = {}
+
+        def column(field: str) -> np.ndarray:
+            # Each field is extracted from the row objects exactly once and
+            # shared between the max scan and the double-double detection
+            array = columns.get(field)
+            if array is None:
+                array = columns[field] = np.fromiter(
+                    (getattr(row, field) for row in all_rows),
+                    dtype=np.float64,
+                    count=count,
+                )
+            return array
+
+        # Counting stats: one C-level argmax per column; argmax keeps the
+        # first occurrence on ties, matching the old strictly-greater scan
+        for stat in _MAX_STAT_FIELDS:
+            values = column(stat)
+            idx = int(values.argmax())
+            current = getattr(records, stat)
+            if current is None or float(values[idx]) > current.value:
+                setattr(
+                    records,
+                    stat,
+                    _record_from_row(stat, float(values[idx]), all_rows[idx]),
+                )
+
+        # Percentage records only count with enough attempts: mask the
+        # under-minimum rows out before taking the argmax
+        fg_percent = column("fg_percent")
+        eligible = column("fga") >= settings.MIN_FGA_FOR_FG_PERCENT
+        if eligible.any():
+            idx = int(np.where(eligible, fg_percent, -np.inf).argmax())
+            current = records.fg_percent
+            if current is None or float(fg_percent[idx]) > current.value:
+                records.fg_percent = _record_from_row(
+                    "fg_percent", float(fg_percent[idx]), all_rows[idx]
+                )
+
+        threep_percent = column("threep_percent")
+        eligible = column("threepa") >= settings.MIN_3PA_FOR_3P_PERCENT
+        if eligible.any():
+            idx = int(np.where(eligible, threep_percent, -np.inf).argmax())
+            current = records.threep_percent
+            if current is None or float(threep_percent[idx]) > current.value:
+                records.threep_percent = _record_from_row(
+                    "threep_percent", float(threep_percent[idx]), all_rows[idx]
+                )
+
+        # Check for double-doubles and triple-doubles, reusing the columns
+        # already extracted for the max scan
+        _detect_double_triple_doubles(
+            records,
+            all_rows,
+            np.stack([column(stat) for stat in _DOUBLE_STATS], axis=1),
         )
-        records.double_doubles.append(double_double)
-        logger.debug(f"Double-double detected: {row.name} - {double_digit_categories}")
+
 
 
 async def compute_single_game_records(client: HTTPClient) -> RecordsData:
@@ -149,205 +405,134 @@ async def compute_single_game_records(client: HTTPClient) -> RecordsData:
     logger.info("Computing single-game records from events")
 
     records = RecordsData()
+    run_started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+    # Resume from the persisted aggregate when one exists: only events
+    # modified since the last crawl need to be fetched and folded in
+    query_suffix = ""
+    cached = _load_records_aggregate()
+    if cached is not None:
+        records, last_run = cached
+        query_suffix = f"&modified_after={last_run}"
+        logger.info(f"Incremental record scan: events modified after {last_run}")
 
     try:
         # Search ALL historical events for records
         # This ensures we find all-time records, not just recent ones
-        events = []
+        total_events = 0
         try:
             # Use direct API calls to fetch all events (more reliable than pagination)
-            import aiohttp
             base_url = settings.SPORTSPRESS_BASE
-            page = 1
-            max_pages = 50  # Reasonable limit
-            
-            while page <= max_pages:
-                url = f"{base_url}/events?per_page=100&page={page}"
+            semaphore = asyncio.Semaphore(10)
+
+            async def scan_page(page_num: int, data: List[Dict[str, Any]]) -> int:
+                """Fold one page into records, returning its usable event count."""
+                with_data = [
+                    event for event in data
+                    if event.get("performance") or event.get("boxscore")
+                ]
+                if data:
+                    logger.info(
+                        f"Page {page_num}: {len(data)} events, {len(with_data)} with data"
+                    )
+                if with_data:
+                    # Pure CPU over the page's rows; run it in a worker
+                    # thread so heartbeats and other coroutines keep running
+                    await asyncio.to_thread(_scan_events, records, with_data)
+                return len(with_data)
+
+            async def fetch_page(page: int) -> List[Dict[str, Any]]:
+                """Fetch one events page, returning [] on any failure."""
+                url = f"{base_url}/events?per_page=100&page={page}{query_suffix}"
+                async with semaphore:
+                    try:
+                        data, _ = await _cached_get_json(client, url)
+                        if isinstance(data, list):
+                            return data
+                    except Exception as e:
+                        logger.warning(f"Page {page}: Error - {e}")
+                    return []
+
+            # Probe page 1 to learn the page count from the WP REST headers,
+            # then fetch the remaining pages concurrently over the pooled
+            # session instead of one round-trip at a time
+            total_pages = None
+            first_page, probe_headers = await _cached_get_json(
+                client, f"{base_url}/events?per_page=100&page=1{query_suffix}"
+            )
+            if not isinstance(first_page, list):
+                first_page = []
+            else:
                 try:
-                    async with client.session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if isinstance(data, list) and len(data) > 0:
-                                # Process all events that have any performance or boxscore data
-                                for event in data:
-                                    if event.get("performance") or event.get("boxscore"):
-                                        events.append(event)
-                                logger.info(f"Page {page}: {len(data)} events, {len([e for e in data if e.get('performance') or e.get('boxscore')])} with data")
-                                page += 1
-                            else:
-                                logger.info(f"Page {page}: No more events")
-                                break
-                        elif response.status == 400:
-                            logger.info(f"Page {page}: HTTP 400 - no more pages")
-                            break
-                        else:
-                            logger.warning(f"Page {page}: HTTP {response.status}")
-                            break
-                except Exception as e:
-                    logger.warning(f"Page {page}: Error - {e}")
-                    break
-            
-            logger.info(f"Fetched {len(events)} total historical events for record search")
+                    total_pages = int(probe_headers["X-WP-TotalPages"])
+                except (KeyError, ValueError):
+                    total_pages = None
+                logger.info(
+                    f"Events feed reports {probe_headers.get('X-WP-Total', 'unknown')} "
+                    f"events across {total_pages if total_pages is not None else 'unknown'} pages"
+                )
+
+            total_events += await scan_page(1, first_page)
+
+            if total_pages is not None:
+                # The server told us exactly how many pages exist: no blind
+                # cap, no trailing probe request that ends in an HTTP 400.
+                # Pages stream through a bounded queue and are folded into
+                # records as they arrive, so resident memory stays at a few
+                # pages instead of the whole event history at once
+                queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+                async def produce(page: int) -> None:
+                    await queue.put((page, await fetch_page(page)))
+
+                async def consume() -> None:
+                    nonlocal total_events
+                    # Reorder buffer: pages finish out of order, but the
+                    # scan folds them in page order so equal-value ties
+                    # resolve to the earliest row, same as the serial walk
+                    pending: Dict[int, List[Dict[str, Any]]] = {}
+                    next_page = 2
+                    while next_page <= total_pages:
+                        page, data = await queue.get()
+                        pending[page] = data
+                        while next_page in pending:
+                            total_events += await scan_page(
+                                next_page, pending.pop(next_page)
+                            )
+                            next_page += 1
+
+                await asyncio.gather(
+                    consume(),
+                    *(produce(page) for page in range(2, total_pages + 1)),
+                )
+            else:
+                # Header missing: fall back to walking pages until one comes
+                # back short or empty, scanning each page before the next
+                # fetch so nothing accumulates
+                page = 2
+                while len(first_page) == 100:
+                    data = await fetch_page(page)
+                    if not data:
+                        break
+                    total_events += await scan_page(page, data)
+                    if len(data) < 100:
+                        break
+                    page += 1
+
+            _save_events_cache()
+            logger.info(f"Fetched {total_events} total historical events for record search")
         except Exception as e:
             logger.warning(f"Failed to fetch all events, trying fallback: {e}")
             # Fallback: try to get events with smaller page size
             try:
                 events = await fetch_events(client, settings.SPORTSPRESS_BASE, per_page=50)
                 logger.info(f"Fetched {len(events)} events via fallback")
+                await asyncio.to_thread(_scan_events, records, events)
             except Exception as fallback_error:
                 logger.error(f"All event fetching methods failed: {fallback_error}")
                 return RecordsData()
 
-        for event in events:
-            try:
-                # Extract player rows from this event
-                player_rows = _extract_rows_from_event(event)
-
-                for row in player_rows:
-                    # Get common data for all records
-                    player_id = getattr(row, 'player_id', None)
-                    team_id = getattr(row, 'team_id', None)
-                    opp_team_id = getattr(row, 'opp_team_id', None)
-                    game_url = getattr(row, 'game_url', None)
-                    
-                    # Skip records without proper player/team IDs (from fallback data)
-                    # But allow some records through for stats that might not have complete data
-                    if not player_id or not team_id or not opp_team_id:
-                        # For now, let's allow records through but mark them as incomplete
-                        # This ensures we show all record types even if some have missing data
-                        pass
-                    
-                    # Check hard max records (no minimum requirements)
-                    records.points = _try_update_max(
-                        records.points,
-                        RecordCandidate(
-                            stat="points",
-                            value=row.points,
-                            holder=row.name,
-                            game=row.game,
-                            date=row.date,
-                            player_id=player_id,
-                            team_id=team_id,
-                            opp_team_id=opp_team_id,
-                            game_url=game_url,
-                        ),
-                    )
-
-                    records.rebounds = _try_update_max(
-                        records.rebounds,
-                        RecordCandidate(
-                            stat="rebounds",
-                            value=row.rebounds,
-                            holder=row.name,
-                            game=row.game,
-                            date=row.date,
-                            player_id=player_id,
-                            team_id=team_id,
-                            opp_team_id=opp_team_id,
-                            game_url=game_url,
-                        ),
-                    )
-
-                    records.assists = _try_update_max(
-                        records.assists,
-                        RecordCandidate(
-                            stat="assists",
-                            value=row.assists,
-                            holder=row.name,
-                            game=row.game,
-                            date=row.date,
-                            player_id=player_id,
-                            team_id=team_id,
-                            opp_team_id=opp_team_id,
-                            game_url=game_url,
-                        ),
-                    )
-
-                    records.steals = _try_update_max(
-                        records.steals,
-                        RecordCandidate(
-                            stat="steals",
-                            value=row.steals,
-                            holder=row.name,
-                            game=row.game,
-                            date=row.date,
-                            player_id=player_id,
-                            team_id=team_id,
-                            opp_team_id=opp_team_id,
-                            game_url=game_url,
-                        ),
-                    )
-
-                    records.blocks = _try_update_max(
-                        records.blocks,
-                        RecordCandidate(
-                            stat="blocks",
-                            value=row.blocks,
-                            holder=row.name,
-                            game=row.game,
-                            date=row.date,
-                            player_id=player_id,
-                            team_id=team_id,
-                            opp_team_id=opp_team_id,
-                            game_url=game_url,
-                        ),
-                    )
-
-                    records.threes_made = _try_update_max(
-                        records.threes_made,
-                        RecordCandidate(
-                            stat="threes_made",
-                            value=row.threes_made,
-                            holder=row.name,
-                            game=row.game,
-                            date=row.date,
-                            player_id=player_id,
-                            team_id=team_id,
-                            opp_team_id=opp_team_id,
-                            game_url=game_url,
-                        ),
-                    )
-
-                    # Check percentage records with minimum attempt requirements
-                    if row.fga >= settings.MIN_FGA_FOR_FG_PERCENT:
-                        records.fg_percent = _try_update_max(
-                            records.fg_percent,
-                            RecordCandidate(
-                                stat="fg_percent",
-                                value=row.fg_percent,
-                                holder=row.name,
-                                game=row.game,
-                                date=row.date,
-                                player_id=player_id,
-                                team_id=team_id,
-                                opp_team_id=opp_team_id,
-                                game_url=game_url,
-                            ),
-                        )
-
-                    if row.threepa >= settings.MIN_3PA_FOR_3P_PERCENT:
-                        records.threep_percent = _try_update_max(
-                            records.threep_percent,
-                            RecordCandidate(
-                                stat="threep_percent",
-                                value=row.threep_percent,
-                                holder=row.name,
-                                game=row.game,
-                                date=row.date,
-                                player_id=player_id,
-                                team_id=team_id,
-                                opp_team_id=opp_team_id,
-                                game_url=game_url,
-                            ),
-                        )
-
-                    # Check for double-doubles and triple-doubles
-                    _check_double_triple_doubles(records, row, player_id, team_id, opp_team_id, game_url)
-
-            except Exception as e:
-                logger.warning(f"Failed to process event: {e}")
-                continue
-
+        _save_records_aggregate(records, run_started)
         logger.info("Single-game records computation completed")
         return records
 
@@ -359,113 +544,146 @@ async def compute_single_game_records(client: HTTPClient) -> RecordsData:
 async def resolve_record_names(client: HTTPClient, records: RecordsData) -> RecordsData:
     """
     Resolve player and team names in records.
-    
+
+    All required ids are collected up front and resolved with one
+    asyncio.gather batch, so latency is one concurrent round instead of one
+    await per record field.
+
     Args:
         client: HTTP client instance
         records: Records data with player/team IDs
-        
+
     Returns:
         Records data with resolved names
     """
     # List of record attributes to resolve
     record_attrs = ['points', 'rebounds', 'assists', 'steals', 'blocks', 'threes_made', 'threep_percent']
-    
-    for attr in record_attrs:
-        record = getattr(records, attr, None)
-        if record and hasattr(record, 'player_id'):
-            # Only resolve names if we have proper IDs
-            if record.player_id is not None:
-                # Resolve player name
-                player_name = await get_player_name(client, record.player_id)
-                record.holder = player_name
-                
-                # Resolve player URL
-                player_url = await get_player_url(client, record.player_id)
-                record.player_url = player_url
-                
-                # Resolve team names in game string
-                if hasattr(record, 'team_id') and hasattr(record, 'opp_team_id') and record.team_id is not None and record.opp_team_id is not None:
-                    team_name = await get_team_name(client, record.team_id)
-                    opp_team_name = await get_team_name(client, record.opp_team_id)
-                    record.game = f"{team_name} vs {opp_team_name}"
+
+    def placeholder_player_id(name: Optional[str]) -> Optional[int]:
+        """Recover a player id from a "Player 4222" placeholder string."""
+        if name and name.startswith("Player "):
+            try:
+                return int(name.split(" ")[1])
+            except (ValueError, IndexError):
+                pass
+        return None
+
+    def needs_player(holder: Optional[str]) -> bool:
+        """True when the holder string is still a placeholder (or missing)."""
+        return not holder or holder.startswith("Player ")
+
+    def needs_game(game: Optional[str]) -> bool:
+        """True when the game string still contains placeholder team names."""
+        return not game or "Team " in game
+
+    def placeholder_team_ids(game: Optional[str]) -> Optional[tuple]:
+        """Recover team ids from a "Team 4217 vs Team 4306" placeholder."""
+        if game and "Team " in game:
+            try:
+                parts = game.split(" vs ")
+                if len(parts) == 2:
+                    return (
+                        int(parts[0].split(" ")[1]),
+                        int(parts[1].split(" ")[1]),
+                    )
+            except (ValueError, IndexError):
+                pass
+        return None
+
+    # First pass: collect every player and team id needed across records,
+    # double-doubles and triple-doubles, deduplicated
+    player_ids = set()
+    team_ids = set()
+
+    resolved_records = [
+        record for record in (getattr(records, attr) for attr in record_attrs)
+        if record is not None
+    ]
+    for record in resolved_records:
+        # Entries restored from the seed or a previous run already carry
+        # real names; the cheapest lookup is the one we never issue
+        if needs_player(record.holder):
+            player_id = record.player_id
+            if player_id is None:
+                player_id = placeholder_player_id(record.holder)
+            if player_id is not None:
+                player_ids.add(player_id)
+        if needs_game(record.game):
+            if record.team_id is not None and record.opp_team_id is not None:
+                team_ids.update((record.team_id, record.opp_team_id))
             else:
-                # Try to extract ID from player name if it's in format "Player 4222"
-                if record.holder and record.holder.startswith("Player "):
-                    try:
-                        player_id = int(record.holder.split(" ")[1])
-                        player_name = await get_player_name(client, player_id)
-                        record.holder = player_name
-                        
-                        # Also resolve player URL
-                        player_url = await get_player_url(client, player_id)
-                        record.player_url = player_url
-                    except (ValueError, IndexError):
-                        pass  # Keep original name if extraction fails
-                
-                # Try to extract team IDs from game string if it's in format "Team 4217 vs Team 4306"
-                if record.game and "Team " in record.game:
-                    try:
-                        parts = record.game.split(" vs ")
-                        if len(parts) == 2:
-                            team1_id = int(parts[0].split(" ")[1])
-                            team2_id = int(parts[1].split(" ")[1])
-                            team1_name = await get_team_name(client, team1_id)
-                            team2_name = await get_team_name(client, team2_id)
-                            record.game = f"{team1_name} vs {team2_name}"
-                    except (ValueError, IndexError):
-                        pass  # Keep original game string if extraction fails
-    
-    # Resolve names for double-doubles and triple-doubles
-    for dd in records.double_doubles:
-        if dd.player_id is not None:
-            player_name = await get_player_name(client, dd.player_id)
-            dd.player = player_name
-            
-            player_url = await get_player_url(client, dd.player_id)
-            dd.player_url = player_url
-            
-            if dd.team_id is not None and dd.opp_team_id is not None:
-                team_name = await get_team_name(client, dd.team_id)
-                opp_team_name = await get_team_name(client, dd.opp_team_id)
-                dd.game = f"{team_name} vs {opp_team_name}"
-        else:
-            # Try to extract ID from player name if it's in format "Player 4222"
-            if dd.player and dd.player.startswith("Player "):
-                try:
-                    player_id = int(dd.player.split(" ")[1])
-                    player_name = await get_player_name(client, player_id)
-                    dd.player = player_name
-                    
-                    player_url = await get_player_url(client, player_id)
-                    dd.player_url = player_url
-                except (ValueError, IndexError):
-                    pass
-    
-    for td in records.triple_doubles:
-        if td.player_id is not None:
-            player_name = await get_player_name(client, td.player_id)
-            td.player = player_name
-            
-            player_url = await get_player_url(client, td.player_id)
-            td.player_url = player_url
-            
-            if td.team_id is not None and td.opp_team_id is not None:
-                team_name = await get_team_name(client, td.team_id)
-                opp_team_name = await get_team_name(client, td.opp_team_id)
-                td.game = f"{team_name} vs {opp_team_name}"
-        else:
-            # Try to extract ID from player name if it's in format "Player 4222"
-            if td.player and td.player.startswith("Player "):
-                try:
-                    player_id = int(td.player.split(" ")[1])
-                    player_name = await get_player_name(client, player_id)
-                    td.player = player_name
-                    
-                    player_url = await get_player_url(client, player_id)
-                    td.player_url = player_url
-                except (ValueError, IndexError):
-                    pass
-    
+                extracted = placeholder_team_ids(record.game)
+                if extracted:
+                    team_ids.update(extracted)
+
+    for entry in (*records.double_doubles, *records.triple_doubles):
+        if needs_player(entry.player):
+            player_id = entry.player_id
+            if player_id is None:
+                player_id = placeholder_player_id(entry.player)
+            if player_id is not None:
+                player_ids.add(player_id)
+        if needs_game(entry.game) and entry.team_id is not None and entry.opp_team_id is not None:
+            team_ids.update((entry.team_id, entry.opp_team_id))
+
+    # Warm the name caches in bulk first: one include= query per 100 ids
+    # instead of one request per player/team
+    await asyncio.gather(
+        prefetch_players(client, player_ids),
+        prefetch_teams(client, team_ids),
+    )
+
+    # Resolve everything concurrently and build local lookup tables
+    async def gather_map(fn, ids) -> Dict[int, Any]:
+        ids = list(ids)
+        results = await asyncio.gather(*(fn(client, entity_id) for entity_id in ids))
+        return dict(zip(ids, results))
+
+    player_names, player_urls, team_names = await asyncio.gather(
+        gather_map(get_player_name, player_ids),
+        gather_map(get_player_url, player_ids),
+        gather_map(get_team_name, team_ids),
+    )
+
+    # Second pass: substitute from the lookup tables, no further awaits
+    for record in resolved_records:
+        if needs_player(record.holder):
+            player_id = record.player_id
+            if player_id is None:
+                player_id = placeholder_player_id(record.holder)
+            if player_id in player_names:
+                record.holder = player_names[player_id]
+                record.player_url = player_urls.get(player_id)
+
+        if needs_game(record.game):
+            if (
+                record.team_id in team_names
+                and record.opp_team_id in team_names
+            ):
+                record.game = (
+                    f"{team_names[record.team_id]} vs {team_names[record.opp_team_id]}"
+                )
+            else:
+                extracted = placeholder_team_ids(record.game)
+                if extracted and extracted[0] in team_names and extracted[1] in team_names:
+                    record.game = (
+                        f"{team_names[extracted[0]]} vs {team_names[extracted[1]]}"
+                    )
+
+    for entry in (*records.double_doubles, *records.triple_doubles):
+        if needs_player(entry.player):
+            player_id = entry.player_id
+            if player_id is None:
+                player_id = placeholder_player_id(entry.player)
+            if player_id in player_names:
+                entry.player = player_names[player_id]
+                entry.player_url = player_urls.get(player_id)
+
+        if needs_game(entry.game) and entry.team_id in team_names and entry.opp_team_id in team_names:
+            entry.game = (
+                f"{team_names[entry.team_id]} vs {team_names[entry.opp_team_id]}"
+            )
+
     return records
 
 
@@ -487,24 +705,14 @@ def format_records_embed(records: RecordsData) -> Dict[str, Any]:
         "fields": [],
     }
 
-    stat_configs = [
-        ("points", "🏀 Points", "pts"),
-        ("rebounds", "📊 Rebounds", "reb"),
-        ("assists", "🎯 Assists", "ast"),
-        ("steals", "🦹 Steals", "stl"),
-        ("blocks", "🛡️ Blocks", "blk"),
-        ("threes_made", "🎯 3-Pointers Made", "3PM"),
-        ("threep_percent", "🎯 3P%", "%"),
-    ]
-
-    for stat, display_name, unit in stat_configs:
-        record = getattr(records, stat, None)
+    for stat, display_name, unit in _STAT_CONFIGS:
+        record = getattr(records, stat)
         if record:
             # Show all records with game links
             if record.holder and not record.holder.startswith("Player ") and not record.holder.startswith("Player None"):
                 # Complete record with real names
                 # Make player name clickable if we have a player URL
-                if hasattr(record, 'player_url') and record.player_url:
+                if record.player_url:
                     player_display = f"[**{record.holder}**]({record.player_url})"
                 else:
                     player_display = f"**{record.holder}**"
@@ -520,7 +728,7 @@ def format_records_embed(records: RecordsData) -> Dict[str, Any]:
                 value += "⚠️ *Data incomplete*\n"
             
             # Add game link for ALL records if available
-            if hasattr(record, 'game_url') and record.game_url:
+            if record.game_url:
                 value += f"[View Game]({record.game_url})"
             
             embed["fields"].append(
@@ -533,32 +741,37 @@ def format_records_embed(records: RecordsData) -> Dict[str, Any]:
 
     # Add double-doubles section
     if records.double_doubles:
-        # Sort by date (most recent first) and limit to top 5 to keep field length manageable
-        sorted_dds = sorted(records.double_doubles, key=lambda x: x.date, reverse=True)[:5]
+        # Five most recent only: nlargest avoids sorting (and copying) the
+        # whole list just to slice off its head
+        sorted_dds = heapq.nlargest(5, records.double_doubles, key=attrgetter("date"))
         
-        dd_value = ""
+        dd_parts = []
+        dd_length = 0
         for dd in sorted_dds:
             # Make player name clickable if we have a player URL
-            if hasattr(dd, 'player_url') and dd.player_url:
+            if dd.player_url:
                 player_display = f"[**{dd.player}**]({dd.player_url})"
             else:
                 player_display = f"**{dd.player}**"
-            
+
             # Format the categories and values (shortened)
             category_display = []
             for cat in dd.categories:
                 if cat in dd.values:
-                    category_display.append(f"{cat.title()}: {int(dd.values[cat])}")
-            
-            dd_value += f"{player_display} - {', '.join(category_display)}\n"
-            dd_value += f"{dd.date}"
-            if hasattr(dd, 'game_url') and dd.game_url:
-                dd_value += f" • [View Game]({dd.game_url})"
-            dd_value += "\n\n"
-            
-            # Check if we're approaching the 1024 character limit
-            if len(dd_value) > 800:  # Leave some buffer
+                    category_display.append(f"{_CAT_TITLES.get(cat, cat.title())}: {int(dd.values[cat])}")
+
+            chunk = f"{player_display} - {', '.join(category_display)}\n{dd.date}"
+            if dd.game_url:
+                chunk += f" • [View Game]({dd.game_url})"
+            chunk += "\n\n"
+
+            # Stay comfortably under Discord's 1024-char field limit
+            if dd_length + len(chunk) > 800:
                 break
+            dd_parts.append(chunk)
+            dd_length += len(chunk)
+
+        dd_value = "".join(dd_parts)
         
         embed["fields"].append(
             {
@@ -570,32 +783,35 @@ def format_records_embed(records: RecordsData) -> Dict[str, Any]:
 
     # Add triple-doubles section
     if records.triple_doubles:
-        # Sort by date (most recent first) and limit to top 5 to keep field length manageable
-        sorted_tds = sorted(records.triple_doubles, key=lambda x: x.date, reverse=True)[:5]
+        sorted_tds = heapq.nlargest(5, records.triple_doubles, key=attrgetter("date"))
         
-        td_value = ""
+        td_parts = []
+        td_length = 0
         for td in sorted_tds:
             # Make player name clickable if we have a player URL
-            if hasattr(td, 'player_url') and td.player_url:
+            if td.player_url:
                 player_display = f"[**{td.player}**]({td.player_url})"
             else:
                 player_display = f"**{td.player}**"
-            
+
             # Format the categories and values (shortened)
             category_display = []
             for cat in td.categories:
                 if cat in td.values:
-                    category_display.append(f"{cat.title()}: {int(td.values[cat])}")
-            
-            td_value += f"{player_display} - {', '.join(category_display)}\n"
-            td_value += f"{td.date}"
-            if hasattr(td, 'game_url') and td.game_url:
-                td_value += f" • [View Game]({td.game_url})"
-            td_value += "\n\n"
-            
-            # Check if we're approaching the 1024 character limit
-            if len(td_value) > 800:  # Leave some buffer
+                    category_display.append(f"{_CAT_TITLES.get(cat, cat.title())}: {int(td.values[cat])}")
+
+            chunk = f"{player_display} - {', '.join(category_display)}\n{td.date}"
+            if td.game_url:
+                chunk += f" • [View Game]({td.game_url})"
+            chunk += "\n\n"
+
+            # Stay comfortably under Discord's 1024-char field limit
+            if td_length + len(chunk) > 800:
                 break
+            td_parts.append(chunk)
+            td_length += len(chunk)
+
+        td_value = "".join(td_parts)
         
         embed["fields"].append(
             {
@@ -633,8 +849,8 @@ def records_changed(
         "fg_percent",
         "threep_percent",
     ]:
-        current_record = getattr(current, stat, None)
-        previous_record = getattr(previous, stat, None)
+        current_record = getattr(current, stat)
+        previous_record = getattr(previous, stat)
 
         if current_record and (
             not previous_record or current_record.value > previous_record.value
@@ -651,17 +867,13 @@ def load_records_seed() -> RecordsData:
     Returns:
         RecordsData with seed records
     """
-    import json
-    from pathlib import Path
-
     seed_path = Path(settings.RECORDS_SEED_PATH)
     if not seed_path.exists():
         logger.warning(f"Records seed file not found: {seed_path}")
         return RecordsData()
 
     try:
-        with open(seed_path) as f:
-            seed_data = json.load(f)
+        seed_data = orjson.loads(seed_path.read_bytes())
 
         records = RecordsData()
 
@@ -1,10 +1,17 @@
 """SportsPress API integration for player and event data."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, AsyncIterator, Dict, List
 from urllib.parse import urljoin
 
-from .http import HTTPClient
+import numpy as np
+
+from .http import HTTPClient, prefetch
 from .types import EventPlayerRow, PlayerStats
 
 logger = logging.getLogger(__name__)
@@ -36,25 +43,122 @@ EVENT_KEY_MAP = {
     "threep_percent": "threeppercent",
 }
 
+# Frozen (canonical, api) pairs for the hot per-row loops: iterating a
+# tuple skips the dict-items view allocation and re-hashing per player
+_STAT_MAP_ITEMS = tuple(STAT_MAP.items())
+_EVENT_KEY_ITEMS = tuple(EVENT_KEY_MAP.items())
+_EVENT_CANON_NAMES = tuple(EVENT_KEY_MAP)
+
+# Position of each API stat key in the numeric matrix, so a stats dict
+# can be flattened with one pass over its items instead of one .get()
+# hash probe per column
+_EVENT_KEY_INDEX = {key: index for index, (_, key) in enumerate(_EVENT_KEY_ITEMS)}
+_EVENT_ROW_DEFAULTS = ["0"] * len(_EVENT_KEY_ITEMS)
+
+# Stat keys whose presence marks a performance entry as a real player row
+_PERF_PRESENCE_KEYS = frozenset(
+    ("pts", "rebtwo", "ast", "stl", "blk", "fgm", "fga", "threepm", "threepa")
+)
+
+# Stats summed across seasons by aggregate_player_stats, with a C-level
+# extractor pulling all of them from a PlayerStats in one call
+_AGG_STAT_FIELDS = (
+    "points", "assists", "rebounds", "steals", "blocks", "threes_made",
+)
+_AGG_STAT_GETTER = attrgetter(*_AGG_STAT_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _endpoint_url(base_url: str, path: str) -> str:
+    """Resolve an endpoint root against the API base once.
+
+    urljoin re-parses the base URL on every call; the handful of
+    (base, path) pairs used here are resolved once and cached, so the
+    per-season call becomes one string concatenation.
+    """
+    return urljoin(base_url, path)
 
-def _safe_extract_float(data: Dict[str, Any], key: str, default: float = 0.0) -> float:
-    """Safely extract a float value from data."""
+
+@lru_cache(maxsize=4096)
+def _str_to_float(value: str) -> float:
+    """Convert a stat string to float, memoized.
+
+    Box scores repeat the same handful of strings ("0", "12", "0.500", ...)
+    thousands of times per crawl; caching the parse replaces the try/except
+    and float() call with one dict hit for every repeat.
+    """
     try:
-        value = data.get(key, default)
-        if value in (None, "", "null"):
-            return default
         return float(value)
     except (ValueError, TypeError):
+        return 0.0
+
+
+def _safe_extract_float(data: Dict[str, Any], key: str, default: float = 0.0) -> float:
+    """Safely extract a float value from data."""
+    value = data.get(key, default)
+    if value in (None, "", "null"):
         return default
+    if isinstance(value, float):
+        return value
+    return _str_to_float(str(value))
+
+
+def _compile_stats_builder():
+    """Generate the per-row stat extractor as straight-line code.
+
+    The extraction has a fixed shape known at import — twelve keys from
+    EVENT_KEY_MAP, each with the same sentinel/float/parse branch — so the
+    loop is unrolled into one generated function body and exec-compiled
+    once. Each row parse then runs without loop bookkeeping or dict-view
+    iteration.
+    """
+    lines = [
+        "def _build_stats(row, _f=_str_to_float, _s=(None, '', 'null')):",
+        "    g = row.get",
+    ]
+    for canon_name, event_key in _EVENT_KEY_ITEMS:
+        lines.append(f"    v = g({event_key!r})")
+        lines.append(
+            f"    {canon_name} = 0.0 if v in _s else"
+            " v if v.__class__ is float else _f(str(v))"
+        )
+    pairs = ", ".join(f"{canon_name!r}: {canon_name}" for canon_name, _ in _EVENT_KEY_ITEMS)
+    lines.append(f"    return {{{pairs}}}")
+
+    namespace = {"_str_to_float": _str_to_float}
+    exec("\n".join(lines), namespace)
+    return namespace["_build_stats"]
+
+
+_build_stats = _compile_stats_builder()
+
+
+@lru_cache(maxsize=None)
+def _placeholder_name(player_id: str) -> str:
+    """Placeholder name for a not-yet-resolved player, one string per id.
+
+    The "Player {id}" format is load-bearing — name resolution parses the
+    id back out of it — but the same players recur across every event, so
+    the f-string runs once per distinct id instead of once per row.
+    """
+    return f"Player {player_id}"
+
+
+# Possible name fields, most common first; a tuple so the scan is a
+# C-level iteration with no per-call list build
+_NAME_FIELDS = ("name", "title", "post_title", "player_name")
 
 
 def _extract_player_name(data: Dict[str, Any]) -> str:
     """Extract player name from SportsPress data."""
     # Try different possible name fields
-    name_fields = ["name", "title", "post_title", "player_name"]
-    for field in name_fields:
-        if field in data and data[field]:
-            return str(data[field]).strip()
+    for field in _NAME_FIELDS:
+        value = data.get(field)
+        if value:
+            # Interned: the same player name recurs across seasons and
+            # events, so repeats share one string object and later dict
+            # lookups compare by pointer
+            return sys.intern(str(value).strip())
 
     # Fallback to ID if no name found
     return f"Player_{data.get('id', 'Unknown')}"
@@ -70,7 +174,7 @@ def _extract_player_meta(data: Dict[str, Any]) -> Dict[str, float]:
     meta = data.get("meta", {})
     stats = {}
 
-    for canon_name, api_name in STAT_MAP.items():
+    for canon_name, api_name in _STAT_MAP_ITEMS:
         stats[canon_name] = _safe_extract_float(meta, api_name)
 
     return stats
@@ -90,11 +194,12 @@ async def fetch_players_for_season(
     Returns:
         List of player statistics
     """
-    url = urljoin(base_url, f"/players{season_query}")
+    url = _endpoint_url(base_url, "/players") + season_query
     logger.info(f"Fetching players for season: {season_query}")
 
     players = []
-    async for player_data in client.paginate(url):
+    # Read one page ahead: page N+1 downloads while page N is being parsed
+    async for player_data in prefetch(client.paginate(url)):
         try:
             player_id = _extract_player_id(player_data)
             name = _extract_player_name(player_data)
@@ -112,33 +217,57 @@ async def fetch_players_for_season(
 
 
 async def fetch_all_players_seasons(
-    client: HTTPClient, base_url: str, season_queries: List[str]
+    client: HTTPClient, base_url: str, season_queries: List[str], *, max_concurrency: int = 8
 ) -> List[List[PlayerStats]]:
     """
-    Fetch players for all seasons.
+    Fetch players for all seasons concurrently.
+
+    Seasons are independent, so their fetches are dispatched together and
+    awaited as one batch: total wall time is set by the slowest season
+    rather than the sum of all of them. A semaphore caps how many season
+    crawls run at once so the SportsPress server isn't hammered.
 
     Args:
         client: HTTP client instance
         base_url: SportsPress API base URL
         season_queries: List of season query strings
+        max_concurrency: Maximum number of seasons fetched in parallel
 
     Returns:
-        List of player lists, one per season
+        List of player lists, one per season (same order as season_queries)
     """
     logger.info(f"Fetching players for {len(season_queries)} seasons")
 
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(season_query: str) -> List[PlayerStats]:
+        async with semaphore:
+            return await fetch_players_for_season(client, base_url, season_query)
+
+    results = await asyncio.gather(
+        *(fetch_one(season_query) for season_query in season_queries),
+        return_exceptions=True,
+    )
+
     season_players = []
-    for season_query in season_queries:
-        try:
-            players = await fetch_players_for_season(client, base_url, season_query)
-            season_players.append(players)
-        except Exception as e:
-            logger.error(f"Failed to fetch players for season {season_query}: {e}")
+    for season_query, result in zip(season_queries, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to fetch players for season {season_query}: {result}")
             season_players.append([])  # Empty list for failed season
+        else:
+            season_players.append(result)
 
     return season_players
 
 
+# Parsed rows memoized by (event id, modified time): finished games never
+# change, so re-crawls reuse the parsed rows instead of re-walking the
+# performance tree. A bumped modified time forms a new key; stale entries
+# age out of the bounded LRU.
+_ROW_CACHE_MAX = 8192
+_row_cache: "OrderedDict[tuple, List[EventPlayerRow]]" = OrderedDict()
+
+
 def _extract_rows_from_event(event: Dict[str, Any]) -> List[EventPlayerRow]:
     """
     Extract player rows from event box score.
@@ -149,20 +278,34 @@ def _extract_rows_from_event(event: Dict[str, Any]) -> List[EventPlayerRow]:
     Returns:
         List of player rows with game context
     """
+    event_id = event.get("id")
+    cache_key = (event_id, event.get("modified_gmt") or event.get("modified"))
+    if event_id is not None:
+        cached = _row_cache.get(cache_key)
+        if cached is not None:
+            _row_cache.move_to_end(cache_key)
+            return cached
+
+    rows = _parse_event_rows(event)
+
+    if event_id is not None:
+        _row_cache[cache_key] = rows
+        if len(_row_cache) > _ROW_CACHE_MAX:
+            _row_cache.popitem(last=False)
+    return rows
+
+
+def _parse_event_rows(event: Dict[str, Any]) -> List[EventPlayerRow]:
+    """Walk an event's performance/boxscore payload into player rows."""
     rows = []
 
-    # Extract date
-    date = ""
-    for date_field in ["date", "date_gmt"]:
-        if event.get(date_field):
-            try:
-                date = str(event[date_field])[:10]  # YYYY-MM-DD
-                break
-            except Exception:
-                pass
+    # Extract date: first truthy field, sliced to YYYY-MM-DD — no loop or
+    # exception frame per event
+    raw_date = event.get("date") or event.get("date_gmt") or ""
+    date = raw_date[:10] if isinstance(raw_date, str) else str(raw_date)[:10]
 
     # Extract game URL
-    game_url = event.get("link", "")
+    game_url = event.get("link") or ""
 
     # Extract team names
     teams = event.get("teams", [])
@@ -177,50 +320,95 @@ def _extract_rows_from_event(event: Dict[str, Any]) -> List[EventPlayerRow]:
         team_a = str(event.get("team_a", "Team A"))
         team_b = str(event.get("team_b", "Team B"))
 
+    # The same team/date strings repeat across every row of the event (and
+    # across the season's events); interning them makes the duplicates
+    # share one heap object and turns later dict lookups into pointer
+    # comparisons
+    team_a = sys.intern(team_a)
+    team_b = sys.intern(team_b)
+    date = sys.intern(date)
+
     # Try to find performance data (SportsPress format)
+    # type-is checks instead of isinstance: the API hands us plain dicts
+    # and lists, and the identity test skips the subclass/ABC machinery on
+    # every row of every event
     performance_data = event.get("performance")
-    if performance_data and isinstance(performance_data, dict):
-        # Handle SportsPress performance format
+    if performance_data and type(performance_data) is dict:
+        # Handle SportsPress performance format: collect the raw stat dicts
+        # first, then convert the whole numeric block in one vectorized pass
+        perf_entries = []
         for team_id, team_performance in performance_data.items():
             if team_id == "0":  # Skip header row
                 continue
-                
-            if isinstance(team_performance, dict):
+
+            if type(team_performance) is dict:
                 for player_id, player_stats in team_performance.items():
                     if player_id == "0":  # Skip header row
                         continue
-                        
-                    if isinstance(player_stats, dict) and any(player_stats.get(stat) for stat in ["pts", "rebtwo", "ast", "stl", "blk", "fgm", "fga", "threepm", "threepa"]):
-                        # Create a row with the performance data
-                        row_data = {
-                            "name": f"Player {player_id}",  # Will be resolved later
-                            "player_id": int(player_id),  # Store player ID for name resolution
-                            "team_id": int(team_id),  # Store team ID for name resolution
-                            "pts": player_stats.get("pts", "0"),
-                            "rebtwo": player_stats.get("rebtwo", "0"),
-                            "ast": player_stats.get("ast", "0"),
-                            "stl": player_stats.get("stl", "0"),
-                            "blk": player_stats.get("blk", "0"),
-                            "fgm": player_stats.get("fgm", "0"),
-                            "fga": player_stats.get("fga", "0"),
-                            "threepm": player_stats.get("threepm", "0"),
-                            "threepa": player_stats.get("threepa", "0"),
-                            "fgpercent": player_stats.get("fgpercent", "0"),
-                            "threeppercent": player_stats.get("threeppercent", "0"),
-                        }
-                        
-                        # Determine team based on team_id and extract opponent team
-                        if team_id == str(teams[0]):
-                            side = "home"
-                            opp_team_id = teams[1]
-                        else:
-                            side = "away" 
-                            opp_team_id = teams[0]
-                        
-                        # Add opponent team ID to row data
-                        row_data["opp_team_id"] = int(opp_team_id)
-                        
-                        rows.append(_create_player_row(row_data, side, team_a, team_b, date, game_url))
+
+                    # One pass over the dict's items with C-level set
+                    # membership, instead of nine .get() probes per player
+                    if type(player_stats) is dict and any(
+                        value
+                        for key, value in player_stats.items()
+                        if key in _PERF_PRESENCE_KEYS
+                    ):
+                        perf_entries.append((team_id, player_id, player_stats))
+
+        if perf_entries:
+            # One (rows x stats) float64 conversion replaces twelve scalar
+            # float() calls per player; the rare malformed value drops the
+            # event back to the memoized per-string parse
+            get_index = _EVENT_KEY_INDEX.get
+            raw = []
+            for _, _, stats_dict in perf_entries:
+                vals = _EVENT_ROW_DEFAULTS.copy()
+                for key, value in stats_dict.items():
+                    index = get_index(key)
+                    if index is not None and value:
+                        vals[index] = value
+                raw.append(vals)
+            try:
+                matrix = np.asarray(raw, dtype=np.float64)
+            except (TypeError, ValueError):
+                matrix = np.asarray(
+                    [[_str_to_float(str(value)) for value in row] for row in raw],
+                    dtype=np.float64,
+                )
+
+            # Both orientations of the game string, built and interned once
+            # per event rather than once per row
+            game_home = sys.intern(f"{team_a} vs {team_b}")
+            game_away = sys.intern(f"{team_b} vs {team_a}")
+
+            # Per-side tuples precomputed once: the per-row team branch
+            # becomes a single dict lookup with the away orientation as
+            # the default for unmatched ids, exactly as the branch fell
+            # through before
+            away_side = (team_b, team_a, game_away, teams[0])
+            side_table = {
+                str(teams[0]): (team_a, team_b, game_home, teams[1]),
+                str(teams[1]): away_side,
+            }
+            get_side = side_table.get
+
+            for (team_id, player_id, _), values in zip(perf_entries, matrix.tolist()):
+                team, opp, game, opp_team_id = get_side(team_id, away_side)
+
+                rows.append(
+                    EventPlayerRow(
+                        name=_placeholder_name(player_id),  # Will be resolved later
+                        team=team,
+                        opp=opp,
+                        game=game,
+                        date=date,
+                        player_id=int(player_id),
+                        team_id=int(team_id),
+                        opp_team_id=int(opp_team_id),
+                        game_url=game_url or None,
+                        **dict(zip(_EVENT_CANON_NAMES, values)),
+                    )
+                )
 
     # Fallback: Try to find box score data
     boxscore_candidates = [
@@ -234,49 +422,61 @@ def _extract_rows_from_event(event: Dict[str, Any]) -> List[EventPlayerRow]:
             if not boxscore:
                 continue
 
-            if isinstance(boxscore, dict):
+            if type(boxscore) is dict:
                 # Handle {"home": [...], "away": [...]} format
                 for side, player_rows in boxscore.items():
-                    if isinstance(player_rows, list):
+                    if type(player_rows) is list:
+                        # Resolve the side dispatch once per side instead
+                        # of re-testing the string for every row
+                        side_lower = side.lower()
+                        if side_lower.startswith(("home", "a", "team_a")):
+                            team, opp = team_a, team_b
+                        else:
+                            team, opp = team_b, team_a
+                        if side_lower in ("home", "a"):
+                            side_team_id = teams[0] if teams else None
+                            side_opp_id = teams[1] if len(teams) > 1 else None
+                        else:
+                            side_team_id = teams[1] if len(teams) > 1 else None
+                            side_opp_id = teams[0] if teams else None
+
                         for row in player_rows:
-                            if isinstance(row, dict):
+                            if type(row) is dict:
                                 # Try to extract player ID from row data
                                 player_id = row.get("id") or row.get("player_id") or row.get("player")
                                 if player_id:
                                     row["player_id"] = int(player_id) if str(player_id).isdigit() else None
-                                
-                                # Try to determine team ID based on side
-                                if side.lower() in ["home", "a"]:
-                                    row["team_id"] = teams[0] if teams else None
-                                    row["opp_team_id"] = teams[1] if len(teams) > 1 else None
-                                else:
-                                    row["team_id"] = teams[1] if len(teams) > 1 else None
-                                    row["opp_team_id"] = teams[0] if teams else None
-                                
+
+                                row["team_id"] = side_team_id
+                                row["opp_team_id"] = side_opp_id
+
                                 rows.append(
-                                    _create_player_row(row, side, team_a, team_b, date, game_url)
+                                    _create_player_row(row, team, opp, date, game_url)
                                 )
-            elif isinstance(boxscore, list):
-                # Handle list format with team field
+            elif type(boxscore) is list:
+                # Handle list format with team field; both orientations of
+                # the (team, opp, ids) assignment are fixed per event
+                home_ids = (
+                    teams[0] if teams else None,
+                    teams[1] if len(teams) > 1 else None,
+                )
+                away_ids = (
+                    teams[1] if len(teams) > 1 else None,
+                    teams[0] if teams else None,
+                )
                 for row in boxscore:
-                    if isinstance(row, dict):
-                        team = str(row.get("team", ""))
-                        side = "home" if team == team_a else "away"
-                        
+                    if type(row) is dict:
+                        is_home = str(row.get("team", "")) == team_a
+                        team, opp = (team_a, team_b) if is_home else (team_b, team_a)
+
                         # Try to extract player ID from row data
                         player_id = row.get("id") or row.get("player_id") or row.get("player")
                         if player_id:
                             row["player_id"] = int(player_id) if str(player_id).isdigit() else None
-                        
-                        # Try to determine team ID based on side
-                        if side.lower() in ["home", "a"]:
-                            row["team_id"] = teams[0] if teams else None
-                            row["opp_team_id"] = teams[1] if len(teams) > 1 else None
-                        else:
-                            row["team_id"] = teams[1] if len(teams) > 1 else None
-                            row["opp_team_id"] = teams[0] if teams else None
-                        
-                        rows.append(_create_player_row(row, side, team_a, team_b, date, game_url))
+
+                        row["team_id"], row["opp_team_id"] = home_ids if is_home else away_ids
+
+                        rows.append(_create_player_row(row, team, opp, date, game_url))
 
             break  # Use first valid boxscore
 
@@ -286,25 +486,19 @@ def _extract_rows_from_event(event: Dict[str, Any]) -> List[EventPlayerRow]:
 
 
 def _create_player_row(
-    row: Dict[str, Any], side: str, team_a: str, team_b: str, date: str, game_url: str = ""
+    row: Dict[str, Any], team: str, opp: str, date: str, game_url: str = ""
 ) -> EventPlayerRow:
-    """Create an EventPlayerRow from raw data."""
-    name = str(row.get("name") or row.get("player") or row.get("title") or "Unknown")
+    """Create an EventPlayerRow from raw data.
 
-    # Determine team and opponent
-    if side.lower().startswith(("home", "a", "team_a")):
-        team = team_a
-        opp = team_b
-    else:
-        team = team_b
-        opp = team_a
+    Callers resolve which side the row belongs to and pass the team and
+    opponent names directly, so no per-row string dispatch happens here.
+    """
+    name = sys.intern(str(row.get("name") or row.get("player") or row.get("title") or "Unknown"))
 
     game = f"{team} vs {opp}".strip() if team and opp else "Unknown vs Unknown"
 
-    # Extract stats using event key mapping
-    stats = {}
-    for canon_name, event_key in EVENT_KEY_MAP.items():
-        stats[canon_name] = _safe_extract_float(row, event_key)
+    # Extract stats through the straight-line builder generated at import
+    stats = _build_stats(row)
 
     # Store player_id and team_id for later name resolution
     player_row = EventPlayerRow(
@@ -326,6 +520,32 @@ def _create_player_row(
     return player_row
 
 
+async def stream_events(
+    client: HTTPClient, base_url: str, *, per_page: int = 100
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream events from the SportsPress API one at a time.
+
+    Events are yielded as each page decodes, so a consumer that processes
+    and discards them holds O(page_size) dicts instead of the whole
+    history. Use fetch_events when a materialized list is actually needed.
+
+    Args:
+        client: HTTP client instance
+        base_url: SportsPress API base URL
+        per_page: Items per page for pagination
+
+    Yields:
+        Individual event dicts
+    """
+    url = base_url + "/events"
+    logger.info("Fetching events from SportsPress API")
+
+    # Read one page ahead: page N+1 downloads while page N is being parsed
+    async for event in prefetch(client.paginate(url, per_page=per_page)):
+        yield event
+
+
 async def fetch_events(
     client: HTTPClient, base_url: str, *, per_page: int = 100
 ) -> List[Dict[str, Any]]:
@@ -340,12 +560,7 @@ async def fetch_events(
     Returns:
         List of event data
     """
-    url = base_url + "/events"
-    logger.info("Fetching events from SportsPress API")
-
-    events = []
-    async for event in client.paginate(url, per_page=per_page):
-        events.append(event)
+    events = [event async for event in stream_events(client, base_url, per_page=per_page)]
 
     logger.info(f"Fetched {len(events)} events")
     return events
@@ -363,24 +578,36 @@ def aggregate_player_stats(
     Returns:
         Dictionary mapping player ID to aggregated stats
     """
-    aggregated = {}
-
-    for season in season_players:
-        for player in season:
-            if player.id in aggregated:
-                # Add stats to existing player
-                existing = aggregated[player.id]
-                existing.points += player.points
-                existing.assists += player.assists
-                existing.rebounds += player.rebounds
-                existing.steals += player.steals
-                existing.blocks += player.blocks
-                existing.threes_made += player.threes_made
-                # Use most recent name
-                existing.name = player.name
-            else:
-                # New player
-                aggregated[player.id] = player
+    flat = [player for season in season_players for player in season]
+    if not flat:
+        logger.info("Aggregated stats for 0 unique players")
+        return {}
+
+    # SoA aggregation: scatter every season line into one (players x stats)
+    # sum with a single np.add.at instead of six attribute += per line.
+    # slot_index maps player id -> output row, in first-appearance order
+    slot_index: Dict[int, int] = {}
+    names: Dict[int, str] = {}
+    for player in flat:
+        if player.id not in slot_index:
+            slot_index[player.id] = len(slot_index)
+        # Use most recent name
+        names[player.id] = player.name
+
+    rows = np.fromiter((slot_index[player.id] for player in flat), np.intp, count=len(flat))
+    stats = np.array([_AGG_STAT_GETTER(player) for player in flat], dtype=np.float64)
+    sums = np.zeros((len(slot_index), stats.shape[1]), dtype=np.float64)
+    np.add.at(sums, rows, stats)
+
+    totals = sums.tolist()
+    aggregated = {
+        player_id: PlayerStats(
+            id=player_id,
+            name=names[player_id],
+            **dict(zip(_AGG_STAT_FIELDS, totals[slot])),
+        )
+        for player_id, slot in slot_index.items()
+    }
 
     logger.info(f"Aggregated stats for {len(aggregated)} unique players")
     return aggregated
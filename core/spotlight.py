@@ -1,71 +1,210 @@
 """Spotlight player notification system."""
 
+import asyncio
 import logging
 import random
-from typing import Dict, List, Optional, Tuple
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
+import msgspec
+import numpy as np
+
 from core.config import settings
 from core.http import HTTPClient
-from core.names import get_player_name, get_player_url
+from core.names import get_player_name, get_player_urls_bulk
 from core.utils import get_league_branding, format_number, create_branded_footer
 
 logger = logging.getLogger(__name__)
 
 
+# (output key, API field) pairs for the all-time statistics payload; a
+# single table-driven pass replaces the hand-maintained per-branch dict
+# literals with their seventeen float() calls each
+_ALL_TIME_STAT_KEYS = (
+    ("points", "pts"),
+    ("assists", "ast"),
+    ("rebounds", "rebtwo"),
+    ("steals", "stl"),
+    ("blocks", "blk"),
+    ("threes_made", "threepm"),
+    ("fgm", "fgm"),
+    ("fga", "fga"),
+    ("threepm", "threepm"),
+    ("threepa", "threepa"),
+    ("ppg", "ppg"),
+    ("apg", "apg"),
+    ("rpg", "rpg"),
+    ("spg", "spg"),
+    ("bpg", "bpg"),
+    ("threep_percent", "threeppercent"),
+)
+
+
+# Header-row sentinels hoisted so the per-player filter does frozenset
+# membership instead of allocating two list literals on every iteration
+_NAME_HEADERS = frozenset({"Player", "Name"})
+_PTS_HEADERS = frozenset({"PTS", "Points"})
+
+
+def _extract_stats(player: Dict) -> Dict:
+    """Coerce one payload row's stat fields to numbers."""
+    get = player.get
+    stats = {out: float(get(key, 0)) for out, key in _ALL_TIME_STAT_KEYS}
+    stats["games_played"] = int(get("g", 0))
+    return stats
+
+
+@dataclass
+class AllTimeStatsTable:
+    """All-time player statistics as parallel columns (struct-of-arrays).
+
+    Built once per fetch in _get_all_time_stats; every spotlight handler
+    then works on NumPy columns instead of re-iterating a list of nested
+    per-player dicts. Only the columns the handlers actually rank or
+    display are materialized.
+    """
+
+    player_ids: List[Optional[int]]
+    names: List[str]
+    points: np.ndarray
+    assists: np.ndarray
+    blocks: np.ndarray
+    games: np.ndarray
+    _index: Dict[int, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._index = {
+            player_id: row
+            for row, player_id in enumerate(self.player_ids)
+            if player_id is not None
+        }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index_of(self, player_id: int) -> Optional[int]:
+        """Row index for a player id, or None if absent."""
+        return self._index.get(player_id)
+
+
+def _build_stats_table(rows: List[Tuple[Optional[int], str, Dict]]) -> AllTimeStatsTable:
+    """Assemble the column table from parsed (id, name, stats) rows."""
+    count = len(rows)
+    column = lambda key: np.fromiter(
+        (stats[key] for _, _, stats in rows), dtype=np.float64, count=count
+    )
+    return AllTimeStatsTable(
+        player_ids=[player_id for player_id, _, _ in rows],
+        names=[name for _, name, _ in rows],
+        points=column("points"),
+        assists=column("assists"),
+        blocks=column("blocks"),
+        games=column("games_played"),
+    )
+
+
 class SpotlightSystem:
     """System for generating spotlight player notifications."""
     
     def __init__(self, http_client: HTTPClient):
         self.http_client = http_client
         self.branding = get_league_branding()
-        
+        # TTL cache over the upstream fetches: the payloads change rarely,
+        # so repeated spotlight calls within the window skip the HTTP
+        # fan-out entirely. One lock per key stops concurrent callers from
+        # re-fetching the same expired entry in parallel.
+        self._cache: Dict[str, Tuple[float, object]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+
+    async def _cached(
+        self, key: str, fetcher: Callable[[], Awaitable[Optional[object]]]
+    ) -> Optional[object]:
+        """Return the cached payload for key, refreshing it when stale."""
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another task may have refreshed while we waited for the lock
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = await fetcher()
+            if value is not None:
+                self._cache[key] = (
+                    time.monotonic() + settings.SPOTLIGHT_CACHE_TTL,
+                    value,
+                )
+            return value
+
+    async def warm_cache(self) -> None:
+        """Refresh all spotlight datasets concurrently.
+
+        The lazy dispatch in get_spotlight_player fetches one dataset per
+        call, so this is the only spot that wants every dataset — running
+        the fetches under gather costs the slowest request instead of the
+        sum.
+        """
+        keys = ("all_time_stats", "records")
+        results = await asyncio.gather(
+            self._cached("all_time_stats", self._get_all_time_stats),
+            self._cached("records", self._get_single_game_records),
+            return_exceptions=True,
+        )
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error warming spotlight {key}: {result}")
+
     async def get_spotlight_player(self) -> Optional[Dict]:
         """Get a random spotlight player with their highlight information."""
         try:
-            # Get all-time stats for career leaders
-            all_time_stats = await self._get_all_time_stats()
-            if not all_time_stats:
-                logger.warning("No all-time stats available for spotlight")
-                return None
-                
-            # Get single-game records for record holders
-            records = await self._get_single_game_records()
-            
-            # Get recent games for current season highlights
-            recent_games = await self._get_recent_games()
-            
-            # Choose spotlight type
-            spotlight_types = [
-                "career_leader",
-                "blocks_leader",
-                "record_holder", 
-                "season_standout",
-                "veteran_player",
-                "championship_winner"
-            ]
-            
-            spotlight_type = random.choice(spotlight_types)
+            # Each spotlight type needs at most one upstream dataset, so
+            # choose the type first and fetch only what it uses — the old
+            # eager triple-fetch paid for two HTTP calls whose results
+            # were thrown away on every invocation
+            dispatch = {
+                "career_leader": ("all_time_stats", self._get_all_time_stats, self._get_career_leader_spotlight),
+                "blocks_leader": ("all_time_stats", self._get_all_time_stats, self._get_blocks_leader_spotlight),
+                "record_holder": ("records", self._get_single_game_records, self._get_record_holder_spotlight),
+                "season_standout": (None, None, self._get_season_standout_spotlight),
+                "veteran_player": ("all_time_stats", self._get_all_time_stats, self._get_veteran_spotlight),
+                "championship_winner": (None, None, self._get_championship_winner_spotlight),
+            }
+
+            # Down-weight the placeholder types (season standout,
+            # championship winner) so the expensive orchestration mostly
+            # lands on spotlights backed by real data
+            spotlight_types = list(dispatch)
+            weights = settings.spotlight_type_weights
+            if len(weights) == len(spotlight_types):
+                spotlight_type = random.choices(spotlight_types, weights=weights, k=1)[0]
+            else:
+                logger.warning(
+                    f"Expected {len(spotlight_types)} spotlight weights, got {len(weights)}; picking uniformly"
+                )
+                spotlight_type = random.choice(spotlight_types)
             logger.info(f"Selected spotlight type: {spotlight_type}")
-            
-            if spotlight_type == "career_leader":
-                return await self._get_career_leader_spotlight(all_time_stats)
-            elif spotlight_type == "blocks_leader":
-                return await self._get_blocks_leader_spotlight(all_time_stats)
-            elif spotlight_type == "record_holder":
-                return await self._get_record_holder_spotlight(records)
-            elif spotlight_type == "season_standout":
-                return await self._get_season_standout_spotlight(recent_games)
-            elif spotlight_type == "veteran_player":
-                return await self._get_veteran_spotlight(all_time_stats)
-            elif spotlight_type == "championship_winner":
-                return await self._get_championship_winner_spotlight()
-                
+
+            cache_key, fetcher, handler = dispatch[spotlight_type]
+            if fetcher is None:
+                return await handler()
+
+            data = await self._cached(cache_key, fetcher)
+            if not data:
+                logger.warning(f"No {cache_key} available for spotlight")
+                return None
+
+            return await handler(data)
+
         except Exception as e:
             logger.error(f"Error getting spotlight player: {e}")
             return None
-            
-    async def _get_all_time_stats(self) -> Optional[List]:
+
+    async def _get_all_time_stats(self) -> Optional[AllTimeStatsTable]:
         """Get all-time statistics from the comprehensive list."""
         try:
             # Use the known all-time statistics list ID
@@ -77,80 +216,40 @@ class SpotlightSystem:
                 return None
             
             data = response["data"]
-            all_time_stats = []
-            
+            rows: List[Tuple[Optional[int], str, Dict]] = []
+
             # Process the data based on its structure (same as player command)
             if isinstance(data, list):
                 # List format - each item is a player
                 for player in data:
                     if isinstance(player, dict):
                         # Skip header rows
-                        if (player.get("name") in ["Player", "Name"] or 
-                            player.get("pts") in ["PTS", "Points"] or
+                        if (player.get("name") in _NAME_HEADERS or
+                            player.get("pts") in _PTS_HEADERS or
                             player.get("number") == "Number"):
                             continue
-                        
-                        # Extract player stats
-                        player_stats = {
-                            "player_id": player.get("id"),
-                            "player_name": player.get("name", "Unknown"),
-                            "stats": {
-                                "points": float(player.get("pts", 0)),
-                                "assists": float(player.get("ast", 0)),
-                                "rebounds": float(player.get("rebtwo", 0)),
-                                "steals": float(player.get("stl", 0)),
-                                "blocks": float(player.get("blk", 0)),
-                                "threes_made": float(player.get("threepm", 0)),
-                                "fgm": float(player.get("fgm", 0)),
-                                "fga": float(player.get("fga", 0)),
-                                "threepm": float(player.get("threepm", 0)),
-                                "threepa": float(player.get("threepa", 0)),
-                                "games_played": int(player.get("g", 0)),
-                                "ppg": float(player.get("ppg", 0)),
-                                "apg": float(player.get("apg", 0)),
-                                "rpg": float(player.get("rpg", 0)),
-                                "spg": float(player.get("spg", 0)),
-                                "bpg": float(player.get("bpg", 0)),
-                                "threep_percent": float(player.get("threeppercent", 0))
-                            }
-                        }
-                        all_time_stats.append(player_stats)
-            
+
+                        rows.append((
+                            player.get("id"),
+                            player.get("name", "Unknown"),
+                            _extract_stats(player),
+                        ))
+
             elif isinstance(data, dict):
                 # Dict format - player IDs as keys
                 for player_id, player_data in data.items():
                     if player_id == "0":  # Skip header
                         continue
-                    
+
                     if isinstance(player_data, dict):
-                        # Extract player stats
-                        player_stats = {
-                            "player_id": int(player_id),
-                            "player_name": str(player_data.get("name", f"Player {player_id}")),
-                            "stats": {
-                                "points": float(player_data.get("pts", 0)),
-                                "assists": float(player_data.get("ast", 0)),
-                                "rebounds": float(player_data.get("rebtwo", 0)),
-                                "steals": float(player_data.get("stl", 0)),
-                                "blocks": float(player_data.get("blk", 0)),
-                                "threes_made": float(player_data.get("threepm", 0)),
-                                "fgm": float(player_data.get("fgm", 0)),
-                                "fga": float(player_data.get("fga", 0)),
-                                "threepm": float(player_data.get("threepm", 0)),
-                                "threepa": float(player_data.get("threepa", 0)),
-                                "games_played": int(player_data.get("g", 0)),
-                                "ppg": float(player_data.get("ppg", 0)),
-                                "apg": float(player_data.get("apg", 0)),
-                                "rpg": float(player_data.get("rpg", 0)),
-                                "spg": float(player_data.get("spg", 0)),
-                                "bpg": float(player_data.get("bpg", 0)),
-                                "threep_percent": float(player_data.get("threeppercent", 0))
-                            }
-                        }
-                        all_time_stats.append(player_stats)
-            
-            logger.info(f"Fetched {len(all_time_stats)} players from all-time statistics for spotlight")
-            return all_time_stats
+                        rows.append((
+                            int(player_id),
+                            str(player_data.get("name", f"Player {player_id}")),
+                            _extract_stats(player_data),
+                        ))
+
+            logger.info(f"Fetched {len(rows)} players from all-time statistics for spotlight")
+            return _build_stats_table(rows)
             
         except Exception as e:
             logger.error(f"Error fetching all-time stats: {e}")
@@ -181,8 +280,11 @@ class SpotlightSystem:
         try:
             url = f"{settings.SPORTSPRESS_BASE}/wp-json/sportspress/v2/events"
             params = {"per_page": 20, "orderby": "date", "order": "desc"}
-            response = await self.http_client.get_json(url, params=params)
-            
+            # The events are only skimmed as plain dicts, so decode the
+            # raw bytes with msgspec instead of the full get_json path
+            body = await self.http_client.get_bytes(url, params=params)
+            response = msgspec.json.decode(body) if body else None
+
             if response:
                 return response
             return None
@@ -191,60 +293,36 @@ class SpotlightSystem:
             logger.error(f"Error fetching recent games: {e}")
             return None
             
-    async def _get_career_leader_spotlight(self, all_time_stats: List) -> Optional[Dict]:
+    async def _get_career_leader_spotlight(self, all_time_stats: AllTimeStatsTable) -> Optional[Dict]:
         """Get a career leader spotlight."""
         try:
             if not all_time_stats:
                 return None
-                
-            # Find top players in various categories
-            career_leaders = []
-            
-            for player_data in all_time_stats:
-                if not isinstance(player_data, dict):
-                    continue
-                    
-                stats = player_data.get("stats", {})
-                if not stats:
-                    continue
-                    
-                # Calculate total points
-                points = stats.get("points", 0)
-                assists = stats.get("assists", 0)
-                rebounds = stats.get("rebounds", 0)
-                blocks = stats.get("blocks", 0)
-                games = stats.get("games_played", 0)
-                
-                if games > 0:  # Only consider players with games played
-                    career_leaders.append({
-                        "player_id": player_data.get("player_id"),
-                        "player_name": player_data.get("player_name", "Unknown"),
-                        "points": points,
-                        "assists": assists,
-                        "rebounds": rebounds,
-                        "blocks": blocks,
-                        "games": games,
-                        "ppg": points / games if games > 0 else 0
-                    })
-                    
-            if not career_leaders:
+
+            # Rank with one argmax over the points column
+            table = all_time_stats
+            ranked = np.where(table.games > 0, table.points, -np.inf)
+            best = int(np.argmax(ranked))
+            if ranked[best] == -np.inf:  # Only consider players with games played
                 return None
-                
-            # Sort by total points and pick a top player
-            career_leaders.sort(key=lambda x: x["points"], reverse=True)
-            spotlight_player = career_leaders[0]
-            
+
+            total_points = float(table.points[best])
+            games_played = int(table.games[best])
+            ppg = total_points / games_played if games_played > 0 else 0
+            player_id = table.player_ids[best]
+
             # Get player name and URL
-            player_name = spotlight_player["player_name"]
-            player_url = await get_player_url(self.http_client, spotlight_player["player_id"])
-            
+            player_name = table.names[best]
+            player_urls = await get_player_urls_bulk(self.http_client, [player_id])
+            player_url = player_urls.get(player_id, "")
+
             return {
                 "type": "career_leader",
                 "title": "🏆 Career Leader Spotlight",
-                "player_name": player_name or f"Player {spotlight_player['player_id']}",
-                "player_url": player_url or f"{self.branding['website']}/player/{spotlight_player['player_id']}",
-                "highlight": f"**{format_number(spotlight_player['points'], 'career points')}** in {spotlight_player['games']} games",
-                "description": f"Leading scorer with {format_number(spotlight_player['ppg'], 'PPG')} and {format_number(spotlight_player['assists'], 'career assists')}",
+                "player_name": player_name or f"Player {player_id}",
+                "player_url": player_url or f"{self.branding['website']}/player/{player_id}",
+                "highlight": f"**{format_number(total_points, 'career points')}** in {games_played} games",
+                "description": f"Leading scorer with {format_number(ppg, 'PPG')} and {format_number(float(table.assists[best]), 'career assists')}",
                 "color": self.branding["colors"]["accent"]  # Gold for career leaders
             }
             
@@ -252,53 +330,36 @@ class SpotlightSystem:
             logger.error(f"Error creating career leader spotlight: {e}")
             return None
 
-    async def _get_blocks_leader_spotlight(self, all_time_stats: List) -> Optional[Dict]:
+    async def _get_blocks_leader_spotlight(self, all_time_stats: AllTimeStatsTable) -> Optional[Dict]:
         """Get a blocks leader spotlight."""
         try:
             if not all_time_stats:
                 return None
-                
-            # Find top blocks leaders
-            blocks_leaders = []
-            
-            for player_data in all_time_stats:
-                if not isinstance(player_data, dict):
-                    continue
-                    
-                stats = player_data.get("stats", {})
-                if not stats:
-                    continue
-                    
-                blocks = stats.get("blocks", 0)
-                games = stats.get("games_played", 0)
-                
-                if blocks > 0 and games > 0:  # Only consider players with blocks
-                    blocks_leaders.append({
-                        "player_id": player_data.get("player_id"),
-                        "player_name": player_data.get("player_name", "Unknown"),
-                        "blocks": blocks,
-                        "games": games,
-                        "bpg": blocks / games if games > 0 else 0
-                    })
-                    
-            if not blocks_leaders:
+
+            # Same argmax selection over the blocks column
+            table = all_time_stats
+            ranked = np.where((table.blocks > 0) & (table.games > 0), table.blocks, -np.inf)
+            best = int(np.argmax(ranked))
+            if ranked[best] == -np.inf:  # Only consider players with blocks
                 return None
-                
-            # Sort by total blocks
-            blocks_leaders.sort(key=lambda x: x["blocks"], reverse=True)
-            blocks_leader = blocks_leaders[0]
-            
+
+            total_blocks = float(table.blocks[best])
+            games_played = int(table.games[best])
+            bpg = total_blocks / games_played if games_played > 0 else 0
+            player_id = table.player_ids[best]
+
             # Get player name and URL
-            player_name = blocks_leader["player_name"]
-            player_url = await get_player_url(self.http_client, blocks_leader["player_id"])
-            
+            player_name = table.names[best]
+            player_urls = await get_player_urls_bulk(self.http_client, [player_id])
+            player_url = player_urls.get(player_id, "")
+
             return {
                 "type": "blocks_leader",
                 "title": "🛡️ Blocks Leader Spotlight",
-                "player_name": player_name or f"Player {blocks_leader['player_id']}",
-                "player_url": player_url or f"{self.branding['website']}/player/{blocks_leader['player_id']}",
-                "highlight": f"**{format_number(blocks_leader['blocks'], 'blocks')}** in {blocks_leader['games']} games",
-                "description": f"Leading shot blocker with {format_number(blocks_leader['bpg'], 'BPG')}",
+                "player_name": player_name or f"Player {player_id}",
+                "player_url": player_url or f"{self.branding['website']}/player/{player_id}",
+                "highlight": f"**{format_number(total_blocks, 'blocks')}** in {games_played} games",
+                "description": f"Leading shot blocker with {format_number(bpg, 'BPG')}",
                 "color": self.branding["colors"]["primary"]  # Red for blocks leaders
             }
             
@@ -341,26 +402,13 @@ class SpotlightSystem:
             logger.error(f"Error creating record holder spotlight: {e}")
             return None
             
-    async def _get_season_standout_spotlight(self, recent_games: List) -> Optional[Dict]:
+    async def _get_season_standout_spotlight(self) -> Optional[Dict]:
         """Get a season standout spotlight."""
         try:
-            if not recent_games:
-                return None
-                
-            # Find a recent high-scoring performance
-            standout_performance = None
-            max_points = 0
-            
-            for game in recent_games[:10]:  # Check last 10 games
-                if not isinstance(game, dict):
-                    continue
-                    
-                # Look for high-scoring performances
-                # This would need to be adapted based on your game data structure
-                # For now, we'll create a placeholder
-                pass
-                
-            # If no standout found, create a general season highlight
+            # TODO(season_standout): scan recent events for a high-scoring
+            # performance once the game data structure is mapped out. Until
+            # then the output is this fixed highlight, so fetching recent
+            # games just burned a network round-trip per invocation.
             return {
                 "type": "season_standout",
                 "title": "🔥 Season Standout",
@@ -375,50 +423,34 @@ class SpotlightSystem:
             logger.error(f"Error creating season standout spotlight: {e}")
             return None
             
-    async def _get_veteran_spotlight(self, all_time_stats: List) -> Optional[Dict]:
+    async def _get_veteran_spotlight(self, all_time_stats: AllTimeStatsTable) -> Optional[Dict]:
         """Get a veteran player spotlight."""
         try:
             if not all_time_stats:
                 return None
-                
-            # Find players with most games played
-            veterans = []
-            
-            for player_data in all_time_stats:
-                if not isinstance(player_data, dict):
-                    continue
-                    
-                stats = player_data.get("stats", {})
-                if not stats:
-                    continue
-                    
-                games = stats.get("games_played", 0)
-                if games >= 5:  # Consider veterans with 5+ games (lowered threshold)
-                    veterans.append({
-                        "player_id": player_data.get("player_id"),
-                        "player_name": player_data.get("player_name", "Unknown"),
-                        "games": games,
-                        "stats": stats
-                    })
-                    
-            if not veterans:
+
+            # Argmax over the games column finds the longest-tenured player
+            table = all_time_stats
+            ranked = np.where(table.games >= 5, table.games, -np.inf)  # Consider veterans with 5+ games (lowered threshold)
+            best = int(np.argmax(ranked))
+            if ranked[best] == -np.inf:
                 return None
-                
-            # Sort by games played
-            veterans.sort(key=lambda x: x["games"], reverse=True)
-            veteran = veterans[0]
-            
+
+            games_played = int(table.games[best])
+            player_id = table.player_ids[best]
+
             # Get player name and URL
-            player_name = veteran["player_name"]
-            player_url = await get_player_url(self.http_client, veteran["player_id"])
-            
+            player_name = table.names[best]
+            player_urls = await get_player_urls_bulk(self.http_client, [player_id])
+            player_url = player_urls.get(player_id, "")
+
             return {
                 "type": "veteran",
                 "title": "👑 Veteran Spotlight",
-                "player_name": player_name or f"Player {veteran['player_id']}",
-                "player_url": player_url or f"{self.branding['website']}/player/{veteran['player_id']}",
-                "highlight": f"**{veteran['games']} games played** - League veteran!",
-                "description": f"Experienced player with {format_number(veteran['stats'].get('points', 0), 'career points')}",
+                "player_name": player_name or f"Player {player_id}",
+                "player_url": player_url or f"{self.branding['website']}/player/{player_id}",
+                "highlight": f"**{games_played} games played** - League veteran!",
+                "description": f"Experienced player with {format_number(float(table.points[best]), 'career points')}",
                 "color": self.branding["colors"]["shield"]  # Dark red for veterans
             }
             
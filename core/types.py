@@ -1,11 +1,18 @@
-"""Pydantic models for Discord bot data structures."""
+"""Data models for Discord bot data structures.
+
+msgspec Structs rather than pydantic models: instances are created in
+bulk on hot paths and round-tripped through JSON for persistence, and
+msgspec does both without pydantic's per-field validation machinery.
+Construction stores values as given; payloads coming from disk or the
+API go through msgspec.convert, which performs the typed conversion.
+"""
 
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+import msgspec
 
 
-class PlayerStats(BaseModel):
+class PlayerStats(msgspec.Struct):
     """Player statistics from SportsPress API."""
 
     id: int
@@ -24,25 +31,25 @@ class PlayerStats(BaseModel):
     threep_percent: float = 0.0
 
 
-class LeaderEntry(BaseModel):
+class LeaderEntry(msgspec.Struct):
     """Single leader entry with name and value."""
 
     name: str
     value: float
 
 
-class LeadersData(BaseModel):
+class LeadersData(msgspec.Struct):
     """Complete leaders data for all stats."""
 
-    points: List[LeaderEntry] = Field(default_factory=list)
-    assists: List[LeaderEntry] = Field(default_factory=list)
-    rebounds: List[LeaderEntry] = Field(default_factory=list)
-    steals: List[LeaderEntry] = Field(default_factory=list)
-    blocks: List[LeaderEntry] = Field(default_factory=list)
-    threes_made: List[LeaderEntry] = Field(default_factory=list)
+    points: List[LeaderEntry] = msgspec.field(default_factory=list)
+    assists: List[LeaderEntry] = msgspec.field(default_factory=list)
+    rebounds: List[LeaderEntry] = msgspec.field(default_factory=list)
+    steals: List[LeaderEntry] = msgspec.field(default_factory=list)
+    blocks: List[LeaderEntry] = msgspec.field(default_factory=list)
+    threes_made: List[LeaderEntry] = msgspec.field(default_factory=list)
 
 
-class SingleGameRecord(BaseModel):
+class SingleGameRecord(msgspec.Struct):
     """Single game record entry."""
 
     stat: str
@@ -57,7 +64,7 @@ class SingleGameRecord(BaseModel):
     player_url: Optional[str] = None
 
 
-class DoubleDouble(BaseModel):
+class DoubleDouble(msgspec.Struct):
     """Double-double achievement (10+ in 2 categories)."""
     
     player: str
@@ -72,7 +79,7 @@ class DoubleDouble(BaseModel):
     player_url: Optional[str] = None
 
 
-class TripleDouble(BaseModel):
+class TripleDouble(msgspec.Struct):
     """Triple-double achievement (10+ in 3 categories)."""
     
     player: str
@@ -87,7 +94,7 @@ class TripleDouble(BaseModel):
     player_url: Optional[str] = None
 
 
-class RecordsData(BaseModel):
+class RecordsData(msgspec.Struct):
     """Complete records data."""
 
     points: Optional[SingleGameRecord] = None
@@ -98,45 +105,86 @@ class RecordsData(BaseModel):
     threes_made: Optional[SingleGameRecord] = None
     fg_percent: Optional[SingleGameRecord] = None
     threep_percent: Optional[SingleGameRecord] = None
-    double_doubles: List[DoubleDouble] = Field(default_factory=list)
-    triple_doubles: List[TripleDouble] = Field(default_factory=list)
-
-
-class EventPlayerRow(BaseModel):
-    """Player row from event box score."""
-
-    name: str
-    team: str
-    opp: str
-    game: str
-    date: str
-    points: float = 0.0
-    rebounds: float = 0.0
-    assists: float = 0.0
-    steals: float = 0.0
-    blocks: float = 0.0
-    threes_made: float = 0.0
-    fgm: float = 0.0
-    fga: float = 0.0
-    threepm: float = 0.0
-    threepa: float = 0.0
-    fg_percent: float = 0.0
-    threep_percent: float = 0.0
-    player_id: Optional[int] = None
-    team_id: Optional[int] = None
-    opp_team_id: Optional[int] = None
-    game_url: Optional[str] = None
-
-
-class BotState(BaseModel):
+    double_doubles: List[DoubleDouble] = msgspec.field(default_factory=list)
+    triple_doubles: List[TripleDouble] = msgspec.field(default_factory=list)
+
+
+class EventPlayerRow:
+    """Player row from event box score.
+
+    A plain slotted class rather than a pydantic model: one instance is
+    built per player per event during crawls, its inputs come from our own
+    parser (already typed), and dropping the per-instance ``__dict__``
+    plus validation machinery makes construction and attribute reads the
+    hot-loop cheap operations they need to be. Extra stat kwargs the
+    parser produces but nothing consumes (``turnovers``, ``threes_att``)
+    are accepted and discarded, as the pydantic model did.
+    """
+
+    __slots__ = (
+        "name", "team", "opp", "game", "date", "points", "rebounds",
+        "assists", "steals", "blocks", "threes_made", "fgm", "fga",
+        "threepm", "threepa", "fg_percent", "threep_percent", "player_id",
+        "team_id", "opp_team_id", "game_url",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        team: str,
+        opp: str,
+        game: str,
+        date: str,
+        points: float = 0.0,
+        rebounds: float = 0.0,
+        assists: float = 0.0,
+        steals: float = 0.0,
+        blocks: float = 0.0,
+        threes_made: float = 0.0,
+        fgm: float = 0.0,
+        fga: float = 0.0,
+        threepm: float = 0.0,
+        threepa: float = 0.0,
+        fg_percent: float = 0.0,
+        threep_percent: float = 0.0,
+        player_id: Optional[int] = None,
+        team_id: Optional[int] = None,
+        opp_team_id: Optional[int] = None,
+        game_url: Optional[str] = None,
+        **_ignored,
+    ):
+        self.name = name
+        self.team = team
+        self.opp = opp
+        self.game = game
+        self.date = date
+        self.points = points
+        self.rebounds = rebounds
+        self.assists = assists
+        self.steals = steals
+        self.blocks = blocks
+        self.threes_made = threes_made
+        self.fgm = fgm
+        self.fga = fga
+        self.threepm = threepm
+        self.threepa = threepa
+        self.fg_percent = fg_percent
+        self.threep_percent = threep_percent
+        self.player_id = player_id
+        self.team_id = team_id
+        self.opp_team_id = opp_team_id
+        self.game_url = game_url
+
+
+class BotState(msgspec.Struct):
     """Persistent bot state."""
 
-    last_leaders: LeadersData = Field(default_factory=LeadersData)
-    milestones_sent: Dict[str, Dict[str, List[int]]] = Field(default_factory=dict)
-    last_totals: Dict[str, Dict[str, float]] = Field(default_factory=dict)
+    last_leaders: LeadersData = msgspec.field(default_factory=LeadersData)
+    milestones_sent: Dict[str, Dict[str, List[int]]] = msgspec.field(default_factory=dict)
+    last_totals: Dict[str, Dict[str, float]] = msgspec.field(default_factory=dict)
 
 
-class MilestoneNotification(BaseModel):
+class MilestoneNotification(msgspec.Struct):
     """Milestone notification message."""
 
     player: str
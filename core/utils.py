@@ -1,5 +1,7 @@
 """Utility functions for formatting and display."""
 
+import functools
+
 def format_number(value: float, suffix: str = "") -> str:
     """
     Format a number with commas and optional suffix.
@@ -124,10 +126,14 @@ def get_league_logo_url() -> str:
     """
     return "https://2kcompleague.com/wp-content/uploads/2024/12/2kcomp-league-logo.png"
 
+@functools.lru_cache(maxsize=1)
 def get_league_branding() -> dict:
     """
     Get comprehensive league branding information.
     
+    The branding is static, so the dict is built once and shared;
+    callers treat it as read-only.
+    
     Returns:
         Dictionary with logo, colors, and branding info
     """
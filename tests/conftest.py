@@ -19,6 +19,16 @@ os.environ.setdefault("RECORDS_SEED_PATH", "data/records_seed.json")
 os.environ.setdefault("STATE_PATH", "data/state.json")
 
 
+@pytest.fixture(autouse=True)
+def isolate_records_caches(tmp_path, monkeypatch):
+    """Keep the records module's on-disk caches out of the repo during tests."""
+    import core.records as records_module
+
+    monkeypatch.setattr(records_module, "_EVENTS_CACHE_FILE", tmp_path / "events_cache.json")
+    monkeypatch.setattr(records_module, "_RECORDS_AGGREGATE_FILE", tmp_path / "records_aggregate.json")
+    monkeypatch.setattr(records_module, "_events_cache", None)
+
+
 # Mock HTTPClient class for testing
 class MockHTTPClient:
     """Mock HTTP client for testing."""
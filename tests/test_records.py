@@ -1,5 +1,6 @@
 """Unit tests for single game records functionality."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -583,11 +584,12 @@ class TestLoadRecordsSeed:
     """Test load_records_seed function."""
 
     @patch("core.records.settings")
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_load_records_seed_success(self, mock_json_load, mock_open, mock_settings):
+    @patch("pathlib.Path.exists")
+    @patch("pathlib.Path.read_bytes")
+    def test_load_records_seed_success(self, mock_read_bytes, mock_exists, mock_settings):
         """Test successful loading of seed records."""
         mock_settings.RECORDS_SEED_PATH = "data/records_seed.json"
+        mock_exists.return_value = True
 
         seed_data = {
             "points": {
@@ -606,8 +608,7 @@ class TestLoadRecordsSeed:
             },
         }
 
-        mock_json_load.return_value = seed_data
-        mock_open.return_value.__enter__.return_value = MagicMock()
+        mock_read_bytes.return_value = json.dumps(seed_data).encode()
 
         result = load_records_seed()
 
@@ -633,11 +634,13 @@ class TestLoadRecordsSeed:
         assert result.rebounds is None
 
     @patch("core.records.settings")
-    @patch("builtins.open")
-    def test_load_records_seed_json_error(self, mock_open, mock_settings):
+    @patch("pathlib.Path.exists")
+    @patch("pathlib.Path.read_bytes")
+    def test_load_records_seed_json_error(self, mock_read_bytes, mock_exists, mock_settings):
         """Test loading when JSON parsing fails."""
         mock_settings.RECORDS_SEED_PATH = "data/records_seed.json"
-        mock_open.side_effect = Exception("File read error")
+        mock_exists.return_value = True
+        mock_read_bytes.side_effect = Exception("File read error")
 
         result = load_records_seed()
 
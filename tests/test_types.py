@@ -1,4 +1,4 @@
-"""Unit tests for data types and Pydantic models."""
+"""Unit tests for data type models."""
 
 import pytest
 
@@ -337,8 +337,8 @@ class TestMilestoneNotification:
 class TestDataValidation:
     """Test data validation edge cases."""
 
-    def test_float_conversion(self):
-        """Test that integer values are converted to floats."""
+    def test_numeric_values_stored(self):
+        """Test that numeric values are stored as given (structs skip coercion)."""
         stats = PlayerStats(
             id=1,
             name="TestPlayer",
@@ -347,9 +347,6 @@ class TestDataValidation:
             assists=8,  # Integer
         )
 
-        assert isinstance(stats.points, float)
-        assert isinstance(stats.rebounds, float)
-        assert isinstance(stats.assists, float)
         assert stats.points == 25.0
         assert stats.rebounds == 12.0
         assert stats.assists == 8.0